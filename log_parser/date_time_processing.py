@@ -1,8 +1,251 @@
+import functools
+import numpy as np
 import pandas as pd
 import re
-from utils import clean_text_special_signs, remove_trailing_characters, drop_empty_columns
+import warnings
+from utils import cached_column_transform, clean_text_special_signs_vec, remove_trailing_characters, drop_empty_columns
+
+# Finder patterns are compiled once at import time and shared by the finder classes below.
+_PAT_DD_MM_YYYY_SEP = re.compile(r'^(?:0?[1-9]|[1-2]\d|3[0-1])([-/\.])(?:0?[1-9]|1[0-2])\1\d{4}$')
+_PAT_MM_DD_YYYY_SEP = re.compile(r'^(?:[0]?[1-9]|1[0-2])([-/\.])(?:[0]?[1-9]|[1-2]\d|3[0-1])\1\d{4}$')
+_PAT_YYYY_MM_DD_SEP = re.compile(r'^\d{4}([-/\.])(?:[0]?[1-9]|1[0-2])\1(?:[0]?[1-9]|[1-2]\d|3[0-1])$')
+_PAT_YYYY_DD_MM_SEP = re.compile(r'^\d{4}([-/\.])(?:0?[1-9]|[1-2]\d|3[0-1])\1(?:0?[1-9]|1[0-2])$')
+_PAT_DD_MM_SEP = re.compile(r'(?:[0]?[1-9]|[1-2]\d|3[0-1])(-|/|\.)(?:[0]?[1-9]|1[0-2])')
+_PAT_MM_DD_SEP = re.compile(r'(?:[0]?[1-9]|1[0-2])(-|/|\.)(?:[0]?[1-9]|[1-2]\d|3[0-1])')
+_PAT_PLURAL_DD_MM_YYYY_SEP = re.compile(r'(?:0?[1-9]|[1-2]\d|3[0-1])([-/\.])(?:0?[1-9]|1[0-2])\1\d{4}')
+_PAT_PLURAL_MM_DD_YYYY_SEP = re.compile(r'(?:[0]?[1-9]|1[0-2])([-/\.])(?:[0]?[1-9]|[1-2]\d|3[0-1])\1\d{4}')
+_PAT_PLURAL_YYYY_MM_DD_SEP = re.compile(r'\d{4}([-/\.])(?:[0]?[1-9]|1[0-2])\1(?:[0]?[1-9]|[1-2]\d|3[0-1])')
+_PAT_PLURAL_YYYY_DD_MM_SEP = re.compile(r'\d{4}([-/\.])(?:0?[1-9]|[1-2]\d|3[0-1])\1(?:0?[1-9]|1[0-2])')
+_PAT_DD_MM_YYYY_NO_SEP = re.compile(r'^(?:0?[1-9]|[1-2]\d|3[0-1])(?:0?[1-9]|1[0-2])\d{4}$')
+_PAT_MM_DD_YYYY_NO_SEP = re.compile(r'^(?:[0]?[1-9]|1[0-2])(?:[0]?[1-9]|[1-2]\d|3[0-1])\d{4}$')
+_PAT_YYYY_MM_DD_NO_SEP = re.compile(r'^\d{4}(?:[0]?[1-9]|1[0-2])(?:[0]?[1-9]|[1-2]\d|3[0-1])$')
+_PAT_YYYY_DD_MM_NO_SEP = re.compile(r'^\d{4}(?:0?[1-9]|[1-2]\d|3[0-1])(?:0?[1-9]|1[0-2])$')
+_PAT_DD_MM_YY_NO_SEP = re.compile(r'^(?:0?[1-9]|[1-2]\d|3[0-1])(?:0?[1-9]|1[0-2])\d{2}$')
+_PAT_MM_DD_YY_NO_SEP = re.compile(r'^(?:[0]?[1-9]|1[0-2])(?:[0]?[1-9]|[1-2]\d|3[0-1])\d{2}$')
+_PAT_YY_DD_MM_NO_SEP = re.compile(r'^\d{2}(?:0?[1-9]|[1-2]\d|3[0-1])(?:0?[1-9]|1[0-2])$')
+_PAT_YY_MM_DD_NO_SEP = re.compile(r'^\d{2}(?:[0]?[1-9]|1[0-2])(?:[0]?[1-9]|[1-2]\d|3[0-1])$')
+_PAT_DD_MM_NO_SEP = re.compile(r'^(?:[0]?[1-9]|[1-2]\d|3[0-1])(?:[0]?[1-9]|1[0-2])$')
+_PAT_MM_DD_NO_SEP = re.compile(r'^(?:[0]?[1-9]|1[0-2])(?:[0]?[1-9]|[1-2]\d|3[0-1])$')
+_PAT_24H_WITH_MILLISECONDS = re.compile(r'^(?:[01]\d|\d|2[0-3])([:\.])(?:[0-5]\d|\d)\1(?:[0-5]\d|\d)(?:(:|\.|,)\d{1,6})$')
+_PAT_24H_WITH_SECONDS = re.compile(r'^(?:[01]\d|\d|2[0-3])([:\.])(?:[0-5]\d|\d)\1(?:[0-5]\d|\d)$')
+_PAT_24H_WITHOUT_SECONDS = re.compile(r'^(?:[01]\d|\d|2[0-3])([:\.])(?:[0-5]\d|\d)$')
+_PAT_PLURAL_24H_WITH_MILLISECONDS = re.compile(r'\b(?:[01]?\d|2[0-3])([:\.])(?:[0-5]?\d)\1(?:[0-5]?\d)(?:(:|\.|,)\d{1,6})\b')
+_PAT_PLURAL_24H_WITH_SECONDS = re.compile(r'\b(?:[01]?\d|2[0-3])([:\.])(?:[0-5]?\d)\1(?:[0-5]?\d)\b')
+_PAT_PLURAL_24H_WITHOUT_SECONDS = re.compile(r'\b(?:[01]?\d|2[0-3])([:\.])(?:[0-5]?\d)\b')
+_PAT_24H_WITH_MILLISECONDS_NO_SEP = re.compile(r'^(?:[01]\d|\d|2[0-3])(?:[0-5]\d|\d)(?:[0-5]\d|\d)(?:\d{1,6})$')
+_PAT_24H_WITH_SECONDS_NO_SEP = re.compile(r'^(?:[01]\d|\d|2[0-3])(?:[0-5]\d|\d)(?:[0-5]\d|\d)$')
+_PAT_24H_WITHOUT_SECONDS_NO_SEP = re.compile(r'^(?:[01]\d|\d|2[0-3])(?:[0-5]\d|\d)$')
+
+
+# (width, lowest, highest) of the numeric fields of the no-separator patterns. At the full width of a
+# pattern the split into fields is unambiguous, so such strings are checked with integer arithmetic.
+_DAY = (2, 1, 31)
+_MONTH = (2, 1, 12)
+_YEAR = (4, 0, 9999)
+_SHORT_YEAR = (2, 0, 99)
+_HOUR = (2, 0, 23)
+_MINUTE = (2, 0, 59)
+_FIXED_WIDTH_FIELDS = {
+    _PAT_DD_MM_YYYY_NO_SEP: (_DAY, _MONTH, _YEAR),
+    _PAT_MM_DD_YYYY_NO_SEP: (_MONTH, _DAY, _YEAR),
+    _PAT_YYYY_MM_DD_NO_SEP: (_YEAR, _MONTH, _DAY),
+    _PAT_YYYY_DD_MM_NO_SEP: (_YEAR, _DAY, _MONTH),
+    _PAT_DD_MM_YY_NO_SEP: (_DAY, _MONTH, _SHORT_YEAR),
+    _PAT_MM_DD_YY_NO_SEP: (_MONTH, _DAY, _SHORT_YEAR),
+    _PAT_YY_DD_MM_NO_SEP: (_SHORT_YEAR, _DAY, _MONTH),
+    _PAT_YY_MM_DD_NO_SEP: (_SHORT_YEAR, _MONTH, _DAY),
+    _PAT_DD_MM_NO_SEP: (_DAY, _MONTH),
+    _PAT_MM_DD_NO_SEP: (_MONTH, _DAY),
+    _PAT_24H_WITH_SECONDS_NO_SEP: (_HOUR, _MINUTE, _MINUTE),
+    _PAT_24H_WITHOUT_SECONDS_NO_SEP: (_HOUR, _MINUTE),
+}
+_FIXED_WIDTHS = {pattern: sum(width for width, _, _ in fields) for pattern, fields in _FIXED_WIDTH_FIELDS.items()}
+
+
+def _fixed_width_mask(values, pattern):
+    """
+    Checks which values of a Series fully match a no-separator pattern, without a Python call per value.
+
+    Full-width digit strings are decoded into a (rows, width) digit matrix with numpy and every field
+    is range-checked column by column; the remaining values are matched with the regex.
+
+    Args:
+        values (pd.Series): The cleaned string values to check.
+        pattern (re.Pattern): The compiled no-separator pattern.
+
+    Returns:
+        pd.Series: A boolean Series indicating which values match the pattern.
+    """
+    width = _FIXED_WIDTHS[pattern]
+    result = np.zeros(len(values), dtype=bool)
+    is_candidate = ((values.str.len() == width) & values.str.isdigit()).to_numpy(dtype=bool)
+    joined = ''.join(values[is_candidate])
+    if joined.isascii():
+        digits = np.frombuffer(joined.encode('ascii'), dtype=np.uint8).reshape(-1, width) - ord('0')
+        matches = np.ones(len(digits), dtype=bool)
+        position = 0
+        for field_width, lowest, highest in _FIXED_WIDTH_FIELDS[pattern]:
+            field = np.zeros(len(digits), dtype=np.int64)
+            for offset in range(field_width):
+                field = field * 10 + digits[:, position + offset]
+            matches &= (field >= lowest) & (field <= highest)
+            position += field_width
+        result[is_candidate] = matches
+    else:
+        is_candidate[:] = False
+    rest = ~is_candidate
+    result[rest] = values[rest].str.fullmatch(pattern, na=False).to_numpy(dtype=bool)
+    return pd.Series(result, index=values.index)
+
 
-class DateFinderSingular:
+def _shift_backreferences(source, offset):
+    """
+    Renumbers the numeric backreferences of a pattern source by the given offset.
+
+    Args:
+        source (str): The pattern source.
+        offset (int): The number of groups inserted in front of the pattern's own groups.
+
+    Returns:
+        str: The pattern source with shifted backreferences.
+    """
+    return re.sub(r'\\(\d+)', lambda match: '\\' + str(int(match.group(1)) + offset), source)
+
+
+@functools.lru_cache(maxsize=None)
+def _capturing_pattern(pattern):
+    """
+    Wraps a finder pattern in a capturing group so that `str.extract` returns the whole match.
+
+    Args:
+        pattern (re.Pattern): The compiled finder pattern.
+
+    Returns:
+        re.Pattern: The compiled pattern whose first group is the whole match.
+    """
+    return re.compile('(' + _shift_backreferences(pattern.pattern, 1) + ')')
+
+
+@functools.lru_cache(maxsize=None)
+def _multiline_pattern(pattern):
+    """
+    Compiles a finder pattern in multiline mode so that `^` and `$` anchor at every line.
+
+    Args:
+        pattern (re.Pattern): The compiled finder pattern.
+
+    Returns:
+        re.Pattern: The same pattern compiled with re.MULTILINE.
+    """
+    return re.compile(pattern.pattern, re.MULTILINE)
+
+
+def _build_union(patterns):
+    """
+    Combines finder patterns into a single alternation with one named group per finder.
+
+    Backreferences are renumbered so that every pattern keeps referring to its own groups.
+
+    Args:
+        patterns (dict): Mapping of finder method names to compiled patterns.
+
+    Returns:
+        re.Pattern: The compiled union pattern; `lastgroup` of a match names the finder.
+    """
+    alternatives = []
+    group_offset = 0
+    for name, pattern in patterns.items():
+        group_offset += 1
+        source = _shift_backreferences(pattern.pattern, group_offset)
+        alternatives.append(f'(?P<{name}>{source})')
+        group_offset += pattern.groups
+    return re.compile('|'.join(alternatives))
+
+
+_DATE_SINGULAR_PATTERNS = {
+    'find_dd_mm_yyyy_sep': _PAT_DD_MM_YYYY_SEP,
+    'find_mm_dd_yyyy_sep': _PAT_MM_DD_YYYY_SEP,
+    'find_yyyy_mm_dd_sep': _PAT_YYYY_MM_DD_SEP,
+    'find_yyyy_dd_mm_sep': _PAT_YYYY_DD_MM_SEP,
+    'find_dd_mm_sep': _PAT_DD_MM_SEP,
+    'find_mm_dd_sep': _PAT_MM_DD_SEP,
+}
+_DATE_SINGULAR_UNION = _build_union(_DATE_SINGULAR_PATTERNS)
+
+_DATE_PLURAL_PATTERNS = {
+    'find_dd_mm_yyyy_sep': _PAT_PLURAL_DD_MM_YYYY_SEP,
+    'find_mm_dd_yyyy_sep': _PAT_PLURAL_MM_DD_YYYY_SEP,
+    'find_yyyy_mm_dd_sep': _PAT_PLURAL_YYYY_MM_DD_SEP,
+    'find_yyyy_dd_mm_sep': _PAT_PLURAL_YYYY_DD_MM_SEP,
+    'find_dd_mm_sep': _PAT_DD_MM_SEP,
+    'find_mm_dd_sep': _PAT_MM_DD_SEP,
+}
+_DATE_PLURAL_UNION = _build_union(_DATE_PLURAL_PATTERNS)
+
+_DATE_NO_SEP_PATTERNS = {
+    'find_dd_mm_yyyy_no_sep': _PAT_DD_MM_YYYY_NO_SEP,
+    'find_mm_dd_yyyy_no_sep': _PAT_MM_DD_YYYY_NO_SEP,
+    'find_yyyy_mm_dd_no_sep': _PAT_YYYY_MM_DD_NO_SEP,
+    'find_yyyy_dd_mm_no_sep': _PAT_YYYY_DD_MM_NO_SEP,
+    'find_dd_mm_yy_no_sep': _PAT_DD_MM_YY_NO_SEP,
+    'find_mm_dd_yy_no_sep': _PAT_MM_DD_YY_NO_SEP,
+    'find_yy_dd_mm_no_sep': _PAT_YY_DD_MM_NO_SEP,
+    'find_yy_mm_dd_no_sep': _PAT_YY_MM_DD_NO_SEP,
+    'find_dd_mm_no_sep': _PAT_DD_MM_NO_SEP,
+    'find_mm_dd_no_sep': _PAT_MM_DD_NO_SEP,
+}
+_DATE_NO_SEP_UNION = _build_union(_DATE_NO_SEP_PATTERNS)
+
+_TIME_SINGULAR_PATTERNS = {
+    'find_24h_format_with_milliseconds': _PAT_24H_WITH_MILLISECONDS,
+    'find_24h_format_with_seconds': _PAT_24H_WITH_SECONDS,
+    'find_24h_format_without_seconds': _PAT_24H_WITHOUT_SECONDS,
+}
+_TIME_SINGULAR_UNION = _build_union(_TIME_SINGULAR_PATTERNS)
+
+_TIME_PLURAL_PATTERNS = {
+    'find_24h_format_with_milliseconds': _PAT_PLURAL_24H_WITH_MILLISECONDS,
+    'find_24h_format_with_seconds': _PAT_PLURAL_24H_WITH_SECONDS,
+    'find_24h_format_without_seconds': _PAT_PLURAL_24H_WITHOUT_SECONDS,
+}
+_TIME_PLURAL_UNION = _build_union(_TIME_PLURAL_PATTERNS)
+
+_TIME_NO_SEP_PATTERNS = {
+    'find_24h_format_with_milliseconds_no_sep': _PAT_24H_WITH_MILLISECONDS_NO_SEP,
+    'find_24h_format_with_seconds_no_sep': _PAT_24H_WITH_SECONDS_NO_SEP,
+    'find_24h_format_without_seconds_no_sep': _PAT_24H_WITHOUT_SECONDS_NO_SEP,
+}
+_TIME_NO_SEP_UNION = _build_union(_TIME_NO_SEP_PATTERNS)
+
+
+class _UnionFinder:
+    """
+    Base class of the finder classes, sharing the scan over the union of their finder patterns.
+
+    Subclasses set `union` to the union pattern of their `finders`.
+    """
+
+    union = None
+
+    @classmethod
+    def scan(cls, text):
+        """
+        Scans the text once with the union of all finder patterns of the class.
+
+        Args:
+            text (str): The text to scan.
+
+        Returns:
+            tuple: The name of the finder whose pattern matched and the matched string,
+                   or (None, None) if none of the patterns matches.
+        """
+        match = cls.union.search(text)
+        if match is None:
+            return None, None
+        return match.lastgroup, match.group(0)
+
+
+class DateFinderSingular(_UnionFinder):
     """
     A class for finding singular date patterns in a given text.
 
@@ -23,6 +266,7 @@ class DateFinderSingular:
         find_dd_mm_no_sep(): Finds dates in the format ddmm.
         find_mm_dd_no_sep(): Finds dates in the format mmdd.
         find_all_dates(): Finds and returns all matching date patterns in the text.
+        scan(text): Scans the text once with the union of all finder patterns of the class.
     """
 
     def __init__(self, text):
@@ -35,8 +279,7 @@ class DateFinderSingular:
         Returns:
             list: A list of matching date strings.
         """
-        pattern = r'^(?:0?[1-9]|[1-2]\d|3[0-1])([-/\.])(?:0?[1-9]|1[0-2])\1\d{4}$'
-        return [match.group(0) for match in re.finditer(pattern, self.text)]
+        return [match.group(0) for match in _PAT_DD_MM_YYYY_SEP.finditer(self.text)]
 
     def find_mm_dd_yyyy_sep(self):
         """
@@ -45,8 +288,7 @@ class DateFinderSingular:
         Returns:
             list: A list of matching date strings.
         """
-        pattern = r'^(?:[0]?[1-9]|1[0-2])([-/\.])(?:[0]?[1-9]|[1-2]\d|3[0-1])\1\d{4}$'
-        return [match.group(0) for match in re.finditer(pattern, self.text)]
+        return [match.group(0) for match in _PAT_MM_DD_YYYY_SEP.finditer(self.text)]
 
     def find_yyyy_mm_dd_sep(self):
         """
@@ -55,8 +297,7 @@ class DateFinderSingular:
         Returns:
             list: A list of matching date strings.
         """
-        pattern = r'^\d{4}([-/\.])(?:[0]?[1-9]|1[0-2])\1(?:[0]?[1-9]|[1-2]\d|3[0-1])$'
-        return [match.group(0) for match in re.finditer(pattern, self.text)]
+        return [match.group(0) for match in _PAT_YYYY_MM_DD_SEP.finditer(self.text)]
 
     def find_yyyy_dd_mm_sep(self):
         """
@@ -65,8 +306,7 @@ class DateFinderSingular:
         Returns:
             list: A list of matching date strings.
         """
-        pattern = r'^\d{4}([-/\.])(?:0?[1-9]|[1-2]\d|3[0-1])\1(?:0?[1-9]|1[0-2])$'
-        return [match.group(0) for match in re.finditer(pattern, self.text)]
+        return [match.group(0) for match in _PAT_YYYY_DD_MM_SEP.finditer(self.text)]
 
     def find_dd_mm_sep(self):
         """
@@ -75,8 +315,7 @@ class DateFinderSingular:
         Returns:
             list: A list of matching date strings.
         """
-        pattern = r'(?:[0]?[1-9]|[1-2]\d|3[0-1])(-|/|\.)(?:[0]?[1-9]|1[0-2])'
-        return [match.group(0) for match in re.finditer(pattern, self.text)]
+        return [match.group(0) for match in _PAT_DD_MM_SEP.finditer(self.text)]
 
     def find_mm_dd_sep(self):
         """
@@ -85,8 +324,7 @@ class DateFinderSingular:
         Returns:
             list: A list of matching date strings.
         """
-        pattern = r'(?:[0]?[1-9]|1[0-2])(-|/|\.)(?:[0]?[1-9]|[1-2]\d|3[0-1])'
-        return [match.group(0) for match in re.finditer(pattern, self.text)]
+        return [match.group(0) for match in _PAT_MM_DD_SEP.finditer(self.text)]
 
 
     def find_all_dates(self):
@@ -96,17 +334,12 @@ class DateFinderSingular:
         Returns:
             list: A list of all matching date strings.
         """
-        finders = [
-            self.find_dd_mm_yyyy_sep,
-            self.find_mm_dd_yyyy_sep,
-            self.find_yyyy_mm_dd_sep,
-            self.find_yyyy_dd_mm_sep,
-            self.find_dd_mm_sep,
-            self.find_mm_dd_sep
-        ]
-
-        for finder in finders:
-            dates = finder()
+        # The union scan names a finder that matches, so only the finders before it can take precedence
+        matched_finder, _ = self.scan(self.text)
+        if matched_finder is None:
+            return []
+        for finder in self.finders[:self.finders.index(matched_finder) + 1]:
+            dates = getattr(self, finder)()
             if dates:
                 return dates
         return []
@@ -120,7 +353,11 @@ class DateFinderSingular:
         'find_mm_dd_sep',
     ]
 
-class DateFinderPlural:
+    patterns = _DATE_SINGULAR_PATTERNS
+    union = _DATE_SINGULAR_UNION
+
+
+class DateFinderPlural(_UnionFinder):
     """
     A class for finding plural date patterns in a given text.
 
@@ -141,6 +378,7 @@ class DateFinderPlural:
         find_dd_mm_no_sep(): Finds dates in the format ddmm.
         find_mm_dd_no_sep(): Finds dates in the format mmdd.
         find_all_dates(): Finds and returns all matching date patterns in the text.
+        scan(text): Scans the text once with the union of all finder patterns of the class.
     """
 
     def __init__(self, text):
@@ -153,8 +391,7 @@ class DateFinderPlural:
         Returns:
             list: A list of matching date strings.
         """
-        pattern = r'(?:0?[1-9]|[1-2]\d|3[0-1])([-/\.])(?:0?[1-9]|1[0-2])\1\d{4}'
-        return [match.group(0) for match in re.finditer(pattern, self.text)]
+        return [match.group(0) for match in _PAT_PLURAL_DD_MM_YYYY_SEP.finditer(self.text)]
 
     def find_mm_dd_yyyy_sep(self):
         """
@@ -163,8 +400,7 @@ class DateFinderPlural:
         Returns:
             list: A list of matching date strings.
         """
-        pattern = r'(?:[0]?[1-9]|1[0-2])([-/\.])(?:[0]?[1-9]|[1-2]\d|3[0-1])\1\d{4}'
-        return [match.group(0) for match in re.finditer(pattern, self.text)]
+        return [match.group(0) for match in _PAT_PLURAL_MM_DD_YYYY_SEP.finditer(self.text)]
 
     def find_yyyy_mm_dd_sep(self):
         """
@@ -173,8 +409,7 @@ class DateFinderPlural:
         Returns:
             list: A list of matching date strings.
         """
-        pattern = r'\d{4}([-/\.])(?:[0]?[1-9]|1[0-2])\1(?:[0]?[1-9]|[1-2]\d|3[0-1])'
-        return [match.group(0) for match in re.finditer(pattern, self.text)]
+        return [match.group(0) for match in _PAT_PLURAL_YYYY_MM_DD_SEP.finditer(self.text)]
 
     def find_yyyy_dd_mm_sep(self):
         """
@@ -183,8 +418,7 @@ class DateFinderPlural:
         Returns:
             list: A list of matching date strings.
         """
-        pattern = r'\d{4}([-/\.])(?:0?[1-9]|[1-2]\d|3[0-1])\1(?:0?[1-9]|1[0-2])'
-        return [match.group(0) for match in re.finditer(pattern, self.text)]
+        return [match.group(0) for match in _PAT_PLURAL_YYYY_DD_MM_SEP.finditer(self.text)]
 
     def find_dd_mm_sep(self):
         """
@@ -193,8 +427,7 @@ class DateFinderPlural:
         Returns:
             list: A list of matching date strings.
         """
-        pattern = r'(?:[0]?[1-9]|[1-2]\d|3[0-1])(-|/|\.)(?:[0]?[1-9]|1[0-2])'
-        return [match.group(0) for match in re.finditer(pattern, self.text)]
+        return [match.group(0) for match in _PAT_DD_MM_SEP.finditer(self.text)]
 
     def find_mm_dd_sep(self):
         """
@@ -203,8 +436,7 @@ class DateFinderPlural:
         Returns:
             list: A list of matching date strings.
         """
-        pattern = r'(?:[0]?[1-9]|1[0-2])(-|/|\.)(?:[0]?[1-9]|[1-2]\d|3[0-1])'
-        return [match.group(0) for match in re.finditer(pattern, self.text)]
+        return [match.group(0) for match in _PAT_MM_DD_SEP.finditer(self.text)]
 
 
     def find_all_dates(self):
@@ -214,17 +446,12 @@ class DateFinderPlural:
         Returns:
             list: A list of all matching date strings.
         """
-        finders = [
-            self.find_dd_mm_yyyy_sep,
-            self.find_mm_dd_yyyy_sep,
-            self.find_yyyy_mm_dd_sep,
-            self.find_yyyy_dd_mm_sep,
-            self.find_dd_mm_sep,
-            self.find_mm_dd_sep,
-        ]
+        # Texts in which the union scan finds nothing cannot match any of the finders
+        if self.scan(self.text)[0] is None:
+            return []
         dates = []
-        for finder in finders:
-            dates.extend(finder())
+        for finder in self.finders:
+            dates.extend(getattr(self, finder)())
         return dates
 
     finders = [
@@ -236,8 +463,11 @@ class DateFinderPlural:
         'find_mm_dd_sep',
     ]
 
+    patterns = _DATE_PLURAL_PATTERNS
+    union = _DATE_PLURAL_UNION
 
-class DateFinderNoSep:
+
+class DateFinderNoSep(_UnionFinder):
     """
     A class for finding singular date patterns in a given text.
 
@@ -252,6 +482,7 @@ class DateFinderNoSep:
         find_dd_mm_no_sep(): Finds dates in the format ddmm.
         find_mm_dd_no_sep(): Finds dates in the format mmdd.
         find_all_dates(): Finds and returns all matching date patterns in the text.
+        scan(text): Scans the text once with the union of all finder patterns of the class.
     """
 
     def __init__(self, text):
@@ -265,8 +496,7 @@ class DateFinderNoSep:
         Returns:
             list: A list of matching date strings.
         """
-        pattern = r'^(?:0?[1-9]|[1-2]\d|3[0-1])(?:0?[1-9]|1[0-2])\d{4}$'
-        return [match.group(0) for match in re.finditer(pattern, self.text)]
+        return [match.group(0) for match in _PAT_DD_MM_YYYY_NO_SEP.finditer(self.text)]
 
     def find_mm_dd_yyyy_no_sep(self):
         """
@@ -275,8 +505,7 @@ class DateFinderNoSep:
         Returns:
             list: A list of matching date strings.
         """
-        pattern = r'^(?:[0]?[1-9]|1[0-2])(?:[0]?[1-9]|[1-2]\d|3[0-1])\d{4}$'
-        return [match.group(0) for match in re.finditer(pattern, self.text)]
+        return [match.group(0) for match in _PAT_MM_DD_YYYY_NO_SEP.finditer(self.text)]
 
     def find_yyyy_mm_dd_no_sep(self):
         """
@@ -285,8 +514,7 @@ class DateFinderNoSep:
         Returns:
             list: A list of matching date strings.
         """
-        pattern = r'^\d{4}(?:[0]?[1-9]|1[0-2])(?:[0]?[1-9]|[1-2]\d|3[0-1])$'
-        return [match.group(0) for match in re.finditer(pattern, self.text)]
+        return [match.group(0) for match in _PAT_YYYY_MM_DD_NO_SEP.finditer(self.text)]
 
     def find_yyyy_dd_mm_no_sep(self):
         """
@@ -295,8 +523,7 @@ class DateFinderNoSep:
         Returns:
             list: A list of matching date strings.
         """
-        pattern = r'^\d{4}(?:0?[1-9]|[1-2]\d|3[0-1])(?:0?[1-9]|1[0-2])$'
-        return [match.group(0) for match in re.finditer(pattern, self.text)]
+        return [match.group(0) for match in _PAT_YYYY_DD_MM_NO_SEP.finditer(self.text)]
 
 
     def find_dd_mm_yy_no_sep(self):
@@ -306,8 +533,7 @@ class DateFinderNoSep:
         Returns:
             list: A list of matching date strings.
         """
-        pattern = r'^(?:0?[1-9]|[1-2]\d|3[0-1])(?:0?[1-9]|1[0-2])\d{2}$'
-        return [match.group(0) for match in re.finditer(pattern, self.text)]
+        return [match.group(0) for match in _PAT_DD_MM_YY_NO_SEP.finditer(self.text)]
 
     def find_mm_dd_yy_no_sep(self):
         """
@@ -316,8 +542,7 @@ class DateFinderNoSep:
         Returns:
             list: A list of matching date strings.
         """
-        pattern = r'^(?:[0]?[1-9]|1[0-2])(?:[0]?[1-9]|[1-2]\d|3[0-1])\d{2}$'
-        return [match.group(0) for match in re.finditer(pattern, self.text)]
+        return [match.group(0) for match in _PAT_MM_DD_YY_NO_SEP.finditer(self.text)]
     
     def find_yy_dd_mm_no_sep(self):
         """
@@ -326,8 +551,7 @@ class DateFinderNoSep:
         Returns:
             list: A list of matching date strings.
         """
-        pattern = r'^\d{2}(?:0?[1-9]|[1-2]\d|3[0-1])(?:0?[1-9]|1[0-2])$'
-        return [match.group(0) for match in re.finditer(pattern, self.text)]
+        return [match.group(0) for match in _PAT_YY_DD_MM_NO_SEP.finditer(self.text)]
 
     def find_yy_mm_dd_no_sep(self):
         """
@@ -336,8 +560,7 @@ class DateFinderNoSep:
         Returns:
             list: A list of matching date strings.
         """
-        pattern = r'^\d{2}(?:[0]?[1-9]|1[0-2])(?:[0]?[1-9]|[1-2]\d|3[0-1])$'
-        return [match.group(0) for match in re.finditer(pattern, self.text)]
+        return [match.group(0) for match in _PAT_YY_MM_DD_NO_SEP.finditer(self.text)]
 
     def find_dd_mm_no_sep(self):
         """
@@ -346,8 +569,7 @@ class DateFinderNoSep:
         Returns:
             list: A list of matching date strings.
         """
-        pattern = r'^(?:[0]?[1-9]|[1-2]\d|3[0-1])(?:[0]?[1-9]|1[0-2])$'
-        return [match.group(0) for match in re.finditer(pattern, self.text)]
+        return [match.group(0) for match in _PAT_DD_MM_NO_SEP.finditer(self.text)]
 
     def find_mm_dd_no_sep(self):
         """
@@ -356,9 +578,7 @@ class DateFinderNoSep:
         Returns:
             list: A list of matching date strings.
         """
-        pattern = r'^(?:[0]?[1-9]|1[0-2])(?:[0]?[1-9]|[1-2]\d|3[0-1])$'
-        return [match.group(0) for match in re.finditer(pattern, self.text)]
-
+        return [match.group(0) for match in _PAT_MM_DD_NO_SEP.finditer(self.text)]
 
     finders = [
         'find_dd_mm_yyyy_no_sep',
@@ -373,9 +593,11 @@ class DateFinderNoSep:
         'find_mm_dd_no_sep',
     ]
 
+    patterns = _DATE_NO_SEP_PATTERNS
+    union = _DATE_NO_SEP_UNION
 
 
-class TimeFinderSingular:
+class TimeFinderSingular(_UnionFinder):
     """
     A class to find singular time formats in a given text.
 
@@ -387,6 +609,7 @@ class TimeFinderSingular:
         find_24h_format_with_seconds(): Finds 24-hour format times with seconds.
         find_24h_format_without_seconds(): Finds 24-hour format times without seconds.
         find_all_times(): Finds all times using various formats.
+        scan(text): Scans the text once with the union of all finder patterns of the class.
     """
     def __init__(self, text):
         """
@@ -404,8 +627,7 @@ class TimeFinderSingular:
         Returns:
             list: A list of matching time strings.
         """
-        pattern = r'^(?:[01]\d|\d|2[0-3])([:\.])(?:[0-5]\d|\d)\1(?:[0-5]\d|\d)(?:(:|\.|,)\d{1,6})$'
-        return [match.group(0) for match in re.finditer(pattern, self.text)]
+        return [match.group(0) for match in _PAT_24H_WITH_MILLISECONDS.finditer(self.text)]
 
     def find_24h_format_with_seconds(self):
         """
@@ -414,8 +636,7 @@ class TimeFinderSingular:
         Returns:
             list: A list of matching time strings.
         """
-        pattern = r'^(?:[01]\d|\d|2[0-3])([:\.])(?:[0-5]\d|\d)\1(?:[0-5]\d|\d)$'
-        return [match.group(0) for match in re.finditer(pattern, self.text)]
+        return [match.group(0) for match in _PAT_24H_WITH_SECONDS.finditer(self.text)]
 
     def find_24h_format_without_seconds(self):
         """
@@ -424,8 +645,7 @@ class TimeFinderSingular:
         Returns:
             list: A list of matching time strings.
         """
-        pattern = r'^(?:[01]\d|\d|2[0-3])([:\.])(?:[0-5]\d|\d)$'
-        return [match.group(0) for match in re.finditer(pattern, self.text)]
+        return [match.group(0) for match in _PAT_24H_WITHOUT_SECONDS.finditer(self.text)]
 
     finders = [
         'find_24h_format_with_milliseconds',
@@ -433,7 +653,11 @@ class TimeFinderSingular:
         'find_24h_format_without_seconds',
     ]
 
-class TimeFinderPlural:
+    patterns = _TIME_SINGULAR_PATTERNS
+    union = _TIME_SINGULAR_UNION
+
+
+class TimeFinderPlural(_UnionFinder):
     """
     A class to find plural time formats in a given text.
 
@@ -445,6 +669,7 @@ class TimeFinderPlural:
         find_24h_format_with_seconds(): Finds 24-hour format times with seconds.
         find_24h_format_without_seconds(): Finds 24-hour format times without seconds.
         find_all_times(): Finds all times using various formats.
+        scan(text): Scans the text once with the union of all finder patterns of the class.
     """
     def __init__(self, text):
         """
@@ -462,8 +687,7 @@ class TimeFinderPlural:
         Returns:
             list: A list of matching time strings.
         """
-        pattern = r'\b(?:[01]?\d|2[0-3])([:\.])(?:[0-5]?\d)\1(?:[0-5]?\d)(?:(:|\.|,)\d{1,6})\b'
-        return [match.group(0) for match in re.finditer(pattern, self.text)]
+        return [match.group(0) for match in _PAT_PLURAL_24H_WITH_MILLISECONDS.finditer(self.text)]
 
     def find_24h_format_with_seconds(self):
         """
@@ -472,8 +696,7 @@ class TimeFinderPlural:
         Returns:
             list: A list of matching time strings.
         """
-        pattern = r'\b(?:[01]?\d|2[0-3])([:\.])(?:[0-5]?\d)\1(?:[0-5]?\d)\b'
-        return [match.group(0) for match in re.finditer(pattern, self.text)]
+        return [match.group(0) for match in _PAT_PLURAL_24H_WITH_SECONDS.finditer(self.text)]
 
     def find_24h_format_without_seconds(self):
         """
@@ -482,8 +705,7 @@ class TimeFinderPlural:
         Returns:
             list: A list of matching time strings.
         """
-        pattern = r'\b(?:[01]?\d|2[0-3])([:\.])(?:[0-5]?\d)\b'
-        return [match.group(0) for match in re.finditer(pattern, self.text)]
+        return [match.group(0) for match in _PAT_PLURAL_24H_WITHOUT_SECONDS.finditer(self.text)]
 
     finders = [
         'find_24h_format_with_milliseconds',
@@ -491,8 +713,11 @@ class TimeFinderPlural:
         'find_24h_format_without_seconds',
     ]
 
+    patterns = _TIME_PLURAL_PATTERNS
+    union = _TIME_PLURAL_UNION
 
-class TimeFinderNoSep:
+
+class TimeFinderNoSep(_UnionFinder):
     """
     A class to find singular time formats in a given text.
 
@@ -504,6 +729,7 @@ class TimeFinderNoSep:
         find_24h_format_with_seconds(): Finds 24-hour format times with seconds.
         find_24h_format_without_seconds(): Finds 24-hour format times without seconds.
         find_all_times(): Finds all times using various formats.
+        scan(text): Scans the text once with the union of all finder patterns of the class.
     """
     def __init__(self, text):
         """
@@ -521,8 +747,7 @@ class TimeFinderNoSep:
         Returns:
             list: A list of matching time strings.
         """
-        pattern = r'^(?:[01]\d|\d|2[0-3])(?:[0-5]\d|\d)(?:[0-5]\d|\d)(?:\d{1,6})$'
-        return [match.group(0) for match in re.finditer(pattern, self.text)]
+        return [match.group(0) for match in _PAT_24H_WITH_MILLISECONDS_NO_SEP.finditer(self.text)]
 
     def find_24h_format_with_seconds_no_sep(self):
         """
@@ -531,8 +756,7 @@ class TimeFinderNoSep:
         Returns:
             list: A list of matching time strings.
         """
-        pattern = r'^(?:[01]\d|\d|2[0-3])(?:[0-5]\d|\d)(?:[0-5]\d|\d)$'
-        return [match.group(0) for match in re.finditer(pattern, self.text)]
+        return [match.group(0) for match in _PAT_24H_WITH_SECONDS_NO_SEP.finditer(self.text)]
 
     def find_24h_format_without_seconds_no_sep(self):
         """
@@ -541,8 +765,7 @@ class TimeFinderNoSep:
         Returns:
             list: A list of matching time strings.
         """
-        pattern = r'^(?:[01]\d|\d|2[0-3])(?:[0-5]\d|\d)$'
-        return [match.group(0) for match in re.finditer(pattern, self.text)]
+        return [match.group(0) for match in _PAT_24H_WITHOUT_SECONDS_NO_SEP.finditer(self.text)]
 
     finders = [
         'find_24h_format_with_milliseconds_no_sep',
@@ -550,10 +773,11 @@ class TimeFinderNoSep:
         'find_24h_format_without_seconds_no_sep',
     ]
 
+    patterns = _TIME_NO_SEP_PATTERNS
+    union = _TIME_NO_SEP_UNION
 
 
-
-def process_time_date_columns(df, finder_class=None, column_type='time'):
+def process_time_date_columns(df, finder_class=None, column_type='time', cleaned_cache=None, decisions=None):
     """
     Finds columns in the DataFrame that contain specific patterns (date or time) and processes them.
 
@@ -561,6 +785,10 @@ def process_time_date_columns(df, finder_class=None, column_type='time'):
         df (pd.DataFrame): The input DataFrame.
         finder_class (class, optional): The class used to find patterns. Defaults to None.
         column_type (str, optional): The type of column to process ('date' or 'time'). Defaults to 'date'.
+        cleaned_cache (dict, optional): A cache of cleaned and deduplicated columns shared between calls.
+            Entries are only reused while the column still holds the same values.
+        decisions (list, optional): If given, the finder class, column and finder picked by every
+            identification pass are appended to it.
 
     Returns:
         pd.DataFrame: The processed DataFrame with identified columns cleaned and renamed.
@@ -577,14 +805,30 @@ def process_time_date_columns(df, finder_class=None, column_type='time'):
             tuple: A tuple containing the identified column name and the finder method name.
                    Returns (None, None) if no column is found.
         """
+        # Every column is cleaned and deduplicated once per call, and only its distinct values are matched,
+        # weighted by how often they occur. One union scan first rules out columns no finder can bring to the threshold.
+        cleaned_columns = {}
+        for column in df.columns:
+            if 'Col_' in column:
+                if column not in deduplicated_columns:
+                    deduplicated_columns[column] = cached_unique_value_counts(df[column], cleaned_cache)
+                unique_values, counts = deduplicated_columns[column]
+                if union_hit_rate(unique_values, finder_class.union, counts) >= 0.8:
+                    cleaned_columns[column] = unique_values, counts
+
         for finder in finder_class.finders:
-            for column in df.columns:
-                if 'Col_' in column:
-                    lowercase_values = df[column].apply(clean_text_special_signs)
-                    pattern = lowercase_values.apply(lambda x: bool(apply_finder_method(finder, x, finder_class)))
-                    if pattern.mean() >= 0.8:
-                        return column, finder
-        return None, None
+            for column, (unique_values, counts) in cleaned_columns.items():
+                if reaches_hit_rate(unique_values, finder_class.patterns[finder], 0.8, counts):
+                    return record_decision(finder_class, column, finder)
+        return record_decision(finder_class, None, None)
+
+    def record_decision(finder_class, column, finder):
+        """
+        Appends the result of an identification pass to the decisions list, if one was given.
+        """
+        if decisions is not None:
+            decisions.append((finder_class.__name__, column, finder))
+        return column, finder
 
     def clean_and_rename_column(df, column, finder, finder_class, column_type):
         """
@@ -601,7 +845,7 @@ def process_time_date_columns(df, finder_class=None, column_type='time'):
             pd.DataFrame: The DataFrame with the cleaned and renamed column.
         """
         df[column] = df[column].apply(remove_trailing_characters)
-        df = df.rename(columns={column: column_type})
+        df.rename(columns={column: column_type}, inplace=True)
         return df
 
     def process_mixed_column(df, column, finder, finder_class, column_type):
@@ -618,20 +862,27 @@ def process_time_date_columns(df, finder_class=None, column_type='time'):
         Returns:
             pd.DataFrame: The DataFrame with the processed mixed values column.
         """
-        original_column_index = df.columns.get_loc(column)
-        df.insert(original_column_index + 1, column_type, '')
+        lowercase_values = clean_text_special_signs_vec(df[column])
+        unique_values, _ = unique_value_counts(lowercase_values)
+        unique_extracted = extract_pattern_values(unique_values, finder_class.patterns[finder])
+        extracted = lowercase_values.map(dict(zip(unique_values, unique_extracted)))
 
-        lowercase_values = df[column].apply(clean_text_special_signs)
-        df[column_type] = lowercase_values.apply(
-            lambda x: next(iter(apply_finder_method(finder, x, finder_class)), '') if apply_finder_method(finder, x, finder_class) else x
-        )
-
-        df[column] = df.apply(
-            lambda row: row[column].replace(row[column_type], '') if row[column_type] != '' else row[column], axis=1
-        )
+        original_column_index = df.columns.get_loc(column)
+        df.insert(original_column_index + 1, column_type, extracted.fillna(lowercase_values).to_numpy(dtype=object))
+
+        # Only rows with an extracted value need a replacement, the others are kept as they are
+        values = df[column].to_numpy(dtype=object, copy=True)
+        extracted_values = df[column_type].to_numpy(dtype=object)
+        replace_rows = np.flatnonzero(extracted_values != '')
+        values[replace_rows] = [values[row].replace(extracted_values[row], '') for row in replace_rows]
+        df[column] = values
         df[column] = df[column].apply(remove_trailing_characters)
+        deduplicated_columns.pop(column, None)
         return df
 
+    # The plural pass has to run first when requested, since the column it processes changes what the
+    # singular pass finds. The passes therefore share the deduplicated columns instead of being reordered.
+    deduplicated_columns = {}
     flag = 0
     column_type_plural = column_type.capitalize() + "FinderPlural"
     column_type_singular = column_type.capitalize() + "FinderSingular"
@@ -670,7 +921,168 @@ def apply_finder_method(method_name, text, FinderClass):
     return getattr(finder, method_name)()
 
 
-def _process_day_column(df, candidate_col, target_col):
+def match_pattern_values(values, pattern):
+    """
+    Checks which values of a Series match a finder pattern, without calling a finder per value.
+
+    Full-width no-separator values are checked with numpy arithmetic, other fully anchored
+    patterns are tested with `str.fullmatch` and the remaining ones with `str.contains`.
+
+    Args:
+        values (pd.Series): The cleaned string values to check.
+        pattern (re.Pattern): The compiled finder pattern.
+
+    Returns:
+        pd.Series: A boolean Series indicating which values match the pattern.
+    """
+    if pattern in _FIXED_WIDTHS:
+        return _fixed_width_mask(values, pattern)
+    if pattern.pattern.startswith('^') and pattern.pattern.endswith('$'):
+        return values.str.fullmatch(pattern, na=False)
+    with warnings.catch_warnings():
+        # The finder patterns contain groups for backreferences, which str.contains warns about
+        warnings.simplefilter("ignore", UserWarning)
+        return values.str.contains(pattern, na=False)
+
+
+# Number of rows matched at once before checking whether a hit rate threshold is still reachable.
+_HIT_RATE_BLOCK_SIZE = 2048
+
+
+def reaches_hit_rate(values, pattern, threshold, counts=None):
+    """
+    Checks whether at least the given share of values matches a finder pattern.
+
+    The values are matched block by block, and matching stops as soon as the outcome is decided:
+    either the hits already reach the threshold or the remaining rows can no longer lift them to it.
+
+    Args:
+        values (pd.Series): The cleaned string values to check.
+        pattern (re.Pattern): The compiled finder pattern.
+        threshold (float): The required share of matching values.
+        counts (np.ndarray, optional): The number of rows each value stands for, one row per value by default.
+
+    Returns:
+        bool: True if the share of matching values reaches the threshold, False otherwise.
+    """
+    if counts is None:
+        counts = np.ones(len(values), dtype=np.int64)
+    total = int(counts.sum())
+    if total == 0:
+        return False
+    hits = 0
+    checked = 0
+    for start in range(0, len(values), _HIT_RATE_BLOCK_SIZE):
+        stop = min(start + _HIT_RATE_BLOCK_SIZE, len(values))
+        block_counts = counts[start:stop]
+        matches = match_pattern_values(values.iloc[start:stop], pattern).to_numpy(dtype=bool)
+        hits += int(block_counts[matches].sum())
+        checked += int(block_counts.sum())
+        if hits / total >= threshold:
+            return True
+        if (hits + total - checked) / total < threshold:
+            return False
+    return hits / total >= threshold
+
+
+def union_hit_rate(values, union, counts=None):
+    """
+    Computes the share of values hit by a union pattern with a single scan over the whole column.
+
+    The values are joined with newlines into one buffer that is scanned once in multiline mode,
+    and every match is mapped back to its row through the cumulative value lengths.
+    Values that contain newlines themselves are matched one by one instead.
+
+    Args:
+        values (pd.Series): The cleaned string values to check.
+        union (re.Pattern): The union pattern of a finder class.
+        counts (np.ndarray, optional): The number of rows each value stands for, one row per value by default.
+
+    Returns:
+        float: The share of values containing at least one match, 0.0 for an empty Series.
+    """
+    if values.empty:
+        return 0.0
+    if counts is None:
+        counts = np.ones(len(values), dtype=np.int64)
+    buffer = '\n'.join(values)
+    if buffer.count('\n') != len(values) - 1:
+        hit_rows = match_pattern_values(values, union).to_numpy(dtype=bool)
+    else:
+        starts = np.fromiter((match.start() for match in _multiline_pattern(union).finditer(buffer)), dtype=np.int64)
+        line_ends = np.cumsum(values.str.len().to_numpy() + 1) - 1
+        hit_rows = np.unique(np.searchsorted(line_ends, starts))
+    return int(counts[hit_rows].sum()) / int(counts.sum())
+
+
+def unique_value_counts(values):
+    """
+    Deduplicates the values of a Series, so that patterns only have to be matched once per distinct value.
+
+    Args:
+        values (pd.Series): The cleaned string values.
+
+    Returns:
+        tuple: A Series with the distinct values, most frequent first, and an array with their row counts.
+    """
+    value_counts = values.value_counts(dropna=False)
+    return pd.Series(value_counts.index, dtype=object), value_counts.to_numpy()
+
+
+def cached_unique_value_counts(values, cache=None):
+    """
+    Cleans and deduplicates a column, reusing an earlier result from the cache while the column is unchanged.
+
+    Args:
+        values (pd.Series): The column values.
+        cache (dict, optional): The cache of earlier results, keyed by column name.
+
+    Returns:
+        tuple: A Series with the distinct cleaned values, most frequent first, and an array with their row counts.
+    """
+    return cached_column_transform(values, lambda column: unique_value_counts(clean_text_special_signs_vec(column)), cache)
+
+
+def extract_pattern_values(values, pattern):
+    """
+    Extracts the first match of a finder pattern from every value of a Series in one pass.
+
+    Args:
+        values (pd.Series): The cleaned string values to search.
+        pattern (re.Pattern): The compiled finder pattern.
+
+    Returns:
+        pd.Series: The first matching string of each value, NaN where the pattern does not match.
+    """
+    return values.str.extract(_capturing_pattern(pattern), expand=True)[0]
+
+
+_DAY_PAT = re.compile(r'^(0?[1-9]|[12][0-9]|3[01])$')
+_YEAR_PAT = re.compile(r'^(19[0-9]{2}|2[0-9]{3}|3000)$')
+
+
+def _scan_candidate(df, col, scores=None):
+    """
+    Compute the share of valid day and year values in a candidate column with a single cleaning pass.
+
+    Parameters:
+    df (pd.DataFrame): The DataFrame containing the candidate column.
+    col (str): The name of the candidate column.
+    scores (dict, optional): A cache of already computed shares, keyed by column name.
+
+    Returns:
+    tuple: The share of valid day values and the share of valid year values.
+    """
+    if scores is not None and col in scores:
+        return scores[col]
+    lowercase_values = clean_text_special_signs_vec(df[col])
+    rates = (lowercase_values.str.match(_DAY_PAT).mean(), lowercase_values.str.match(_YEAR_PAT).mean())
+    if scores is not None:
+        scores[col] = rates
+    return rates
+
+
+def _process_day_column(df, candidate_col, target_col, scores=None):
     """
     Process a column as 'day' if it contains valid day values.
 
@@ -682,20 +1094,19 @@ def _process_day_column(df, candidate_col, target_col):
     df (pd.DataFrame): The DataFrame containing the column to be processed.
     candidate_col (str): The name of the candidate column to be checked and processed.
     target_col (str): The name of the target column where the processed day values will be stored.
+    scores (dict, optional): A cache of candidate column shares shared with the other date part lookups.
 
     Returns:
     tuple: A tuple containing the modified DataFrame and a boolean indicating if the column was processed.
     """
-    lowercase_values = df[candidate_col].apply(clean_text_special_signs)
-    valid_day_mask = lowercase_values.str.match(r'^(0?[1-9]|[12][0-9]|3[01])$')
-    if valid_day_mask.mean() >= 0.9:
+    if _scan_candidate(df, candidate_col, scores)[0] >= 0.9:
         df[target_col] = df[candidate_col]
-        df = df.rename(columns={candidate_col: 'day'})
+        df.rename(columns={candidate_col: 'day'}, inplace=True)
         df['day'] = df['day'].apply(remove_trailing_characters)
         return df, True
     return df, False
 
-def find_and_process_day_column(df):
+def find_and_process_day_column(df, scores=None):
     """
     Find and process a day column based on adjacent columns.
 
@@ -705,6 +1116,7 @@ def find_and_process_day_column(df):
 
     Parameters:
     df (pd.DataFrame): The DataFrame in which to find and process the day column.
+    scores (dict, optional): A cache of candidate column shares, reusable as long as the candidate columns are unchanged.
 
     Returns:
     pd.DataFrame: The modified DataFrame with the processed day column.
@@ -722,12 +1134,12 @@ def find_and_process_day_column(df):
             if next_col.startswith('Col_') and next_col != 'Col_13':
                 candidate_columns.append(next_col)
         for col in candidate_columns:
-            df, found = _process_day_column(df, col, col)
+            df, found = _process_day_column(df, col, col, scores)
             if found:
                 return df
     return df
 
-def _process_year_column(df, candidate_col, target_col):
+def _process_year_column(df, candidate_col, target_col, scores=None):
     """
     Process a column as 'year' if it contains valid year values.
 
@@ -739,21 +1151,20 @@ def _process_year_column(df, candidate_col, target_col):
     df (pd.DataFrame): The DataFrame containing the column to be processed.
     candidate_col (str): The name of the candidate column to be checked and processed.
     target_col (str): The name of the target column where the processed year values will be stored.
+    scores (dict, optional): A cache of candidate column shares shared with the other date part lookups.
 
     Returns:
     tuple: A tuple containing the modified DataFrame and a boolean indicating if the column was processed.
     """
-    lowercase_values = df[candidate_col].apply(clean_text_special_signs)
-    valid_year_mask = lowercase_values.str.match(r'^(19[0-9]{2}|2[0-9]{3}|3000)$')
-    if valid_year_mask.mean() >= 0.9:
+    if _scan_candidate(df, candidate_col, scores)[1] >= 0.9:
         df[target_col] = df[candidate_col]
-        df = df.rename(columns={candidate_col: 'year'})
+        df.rename(columns={candidate_col: 'year'}, inplace=True)
         df['year'] = df['year'].apply(remove_trailing_characters)
 
         return df, True
     return df, False
 
-def find_and_process_year_column(df):
+def find_and_process_year_column(df, scores=None):
     """
     Find and process a year column based on adjacent columns.
 
@@ -763,6 +1174,7 @@ def find_and_process_year_column(df):
 
     Parameters:
     df (pd.DataFrame): The DataFrame in which to find and process the year column.
+    scores (dict, optional): A cache of candidate column shares, reusable as long as the candidate columns are unchanged.
 
     Returns:
     pd.DataFrame: The modified DataFrame with the processed year column.
@@ -780,63 +1192,60 @@ def find_and_process_year_column(df):
             if next_col.startswith('Col_') and next_col != 'Col_13':
                 candidate_columns.append(next_col)
         for col in candidate_columns:
-            df, found = _process_year_column(df, col, col)
+            df, found = _process_year_column(df, col, col, scores)
             if found:
                 return df
     return df
 
 
+# 1990-01-01 00:00:00 UTC in epoch seconds, the earliest accepted UTC timestamp.
+_EPOCH_1990_SECONDS = 631152000
+
+
 def process_utc_timestamps(df):
     """Detect and convert columns with UTC timestamps."""
     for column in df.columns:
         if column.startswith("Col_"):
             numeric_values = pd.to_numeric(df[column], errors='coerce')
             if numeric_values.count() / len(df) >= 0.9:
-                converted_times = pd.DataFrame()
-                converted_times['timestamp'] = pd.to_datetime(numeric_values, unit='s', utc=True).dt.strftime('%Y-%m-%d')
-                converted_times['timestamp'] = pd.to_datetime(converted_times['timestamp'])
-                if (converted_times['timestamp'] >= pd.Timestamp('1990-01-01')).all():
+                if (numeric_values >= _EPOCH_1990_SECONDS).all():
                     df.rename(columns={column: "timestamp"}, inplace=True)
                     break
-                else:
-                    pass
     return df
 
 
 
-def identify_columns_date_time_no_sep(df, finder_class):
+def identify_columns_date_time_no_sep(df, finder_class, cleaned_cols=None):
     """
     Identifies columns in the DataFrame that contain values based on the given finder class.
 
     Args:
         df (pd.DataFrame): The input DataFrame.
         finder_class (class): The class used to find patterns.
+        cleaned_cols (dict, optional): A cache of cleaned and deduplicated columns, which can be shared
+            between calls on the same unchanged DataFrame.
 
     Returns:
         list: A list of identified column names.
     """
     identified_columns = []
     seen_columns = set()
-    
+    deduplicated_columns = cleaned_cols if cleaned_cols is not None else {}
+
     for finder in finder_class.finders:
         for column in df.columns:
             if 'Col_' in column and column not in seen_columns:
-                lowercase_values = df[column].apply(clean_text_special_signs)
-                pattern = lowercase_values.apply(lambda x: bool(apply_finder_method(finder, x, finder_class)))
-                if pattern.mean() >= 0.8:
-                    lengths = lowercase_values.apply(len)
-                    length_counts = lengths.value_counts()
-                    if not length_counts.empty:
-                        most_common_length = length_counts.index[0]
-                        valid_lengths = [most_common_length]
-                        if len(length_counts) > 1:
-                            most_common_length2 = length_counts.index[1]
-                            valid_lengths.append(most_common_length2)
-                        length_consistency = lengths.isin(valid_lengths).mean()
-                        if length_consistency >= 0.9:
-                            identified_columns.append(column)
-                            seen_columns.add(column)
-                    
+                if column not in deduplicated_columns:
+                    deduplicated_columns[column] = unique_value_counts(clean_text_special_signs_vec(df[column]))
+                unique_values, counts = deduplicated_columns[column]
+                if reaches_hit_rate(unique_values, finder_class.patterns[finder], 0.8, counts):
+                    # The two most common lengths have to cover at least 90% of the values
+                    length_counts = np.bincount(unique_values.str.len().to_numpy(), weights=counts)
+                    top_two_lengths = np.sort(length_counts)[-2:].sum()
+                    if top_two_lengths / counts.sum() >= 0.9:
+                        identified_columns.append(column)
+                        seen_columns.add(column)
+
     return identified_columns
 
 def process_time_date_no_sep_columns(df):
@@ -850,28 +1259,27 @@ def process_time_date_no_sep_columns(df):
         pd.DataFrame: The DataFrame with renamed columns if applicable.
     """
     if not any(col in df.columns for col in ["time", "date", "year", "day"]):
-        date_columns = identify_columns_date_time_no_sep(df, DateFinderNoSep)
-        time_columns = identify_columns_date_time_no_sep(df, TimeFinderNoSep)
+        cleaned_cols = {}
+        date_columns = identify_columns_date_time_no_sep(df, DateFinderNoSep, cleaned_cols)
+        time_columns = identify_columns_date_time_no_sep(df, TimeFinderNoSep, cleaned_cols)
 
-        date_column_set = set(date_columns)
+        # Lists keep the order in which the columns were identified, so the choice below is deterministic
         time_column_set = set(time_columns)
-
-        common_columns = date_column_set & time_column_set
+        common_columns = [column for column in date_columns if column in time_column_set]
 
         if len(common_columns) >= 2:
-            unique_count_1 = df[common_columns[0]].nunique()
-            unique_count_2 = df[common_columns[1]].nunique()
+            unique_count_1, unique_count_2 = df[common_columns[:2]].nunique()
 
             if unique_count_1 <= unique_count_2:
                 df.rename(columns={common_columns[0]: "date", common_columns[1]: "time"}, inplace=True)
             else:
                 df.rename(columns={common_columns[0]: "time", common_columns[1]: "date"}, inplace=True)
         elif len(common_columns) == 1:
-            common_column = list(common_columns)[0]
+            common_column = common_columns[0]
             df.rename(columns={common_column: "date"}, inplace=True)
 
-            other_date_columns = list(date_column_set - common_columns)
-            other_time_columns = list(time_column_set - common_columns)
+            other_date_columns = [column for column in date_columns if column != common_column]
+            other_time_columns = [column for column in time_columns if column != common_column]
 
             if other_date_columns:
                 df.rename(columns={other_date_columns[0]: "time"}, inplace=True)
@@ -879,8 +1287,7 @@ def process_time_date_no_sep_columns(df):
                 df.rename(columns={other_time_columns[0]: "time"}, inplace=True)
         else:
             if date_columns and time_columns:
-                unique_count_date = df[date_columns[0]].nunique()
-                unique_count_time = df[time_columns[0]].nunique()
+                unique_count_date, unique_count_time = df[[date_columns[0], time_columns[0]]].nunique()
 
                 if unique_count_date <= unique_count_time:
                     df.rename(columns={date_columns[0]: "date", time_columns[0]: "time"}, inplace=True)
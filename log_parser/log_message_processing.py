@@ -1,8 +1,13 @@
 import re
 import os
 import random
+import numpy as np
 import pandas as pd
-import chardet
+# The C port of chardet is used when the optional 'fast' extra is installed, chardet is the default
+try:
+    from cchardet import detect as detect_charset
+except ImportError:
+    from chardet import detect as detect_charset
 from utils import clean_text_special_signs, load_json
 
 
@@ -15,19 +20,41 @@ months = json_data_months['month']
 json_data_weekdays = load_json(weekdays_path)
 weekdays = json_data_weekdays['weekday']
 
-def detect_encoding(file_path):
+# One alternation of all weekday and month names, matched as whole words
+_DOW_MONTH_RE = re.compile(r'\b(?:' + '|'.join(map(re.escape, weekdays + months)) + r')\b')
+
+# Byte order marks checked before any statistical detection, the UTF-32 marks before the UTF-16 ones they start with.
+_BOM_ENCODINGS = [
+    (b'\xef\xbb\xbf', 'utf-8-sig'),
+    (b'\xff\xfe\x00\x00', 'utf-32'),
+    (b'\x00\x00\xfe\xff', 'utf-32'),
+    (b'\xff\xfe', 'utf-16'),
+    (b'\xfe\xff', 'utf-16'),
+]
+_ENCODING_SAMPLE_SIZE = 64 * 1024
+
+def detect_encoding(file_path, sample_size=_ENCODING_SAMPLE_SIZE):
     """
-    Detect the encoding of a file.
+    Detect the encoding of a file from a sample of its first bytes.
+
+    A byte order mark decides the encoding directly and a pure ASCII sample is read as UTF-8,
+    only other samples are passed to the charset detector.
 
     Args:
         file_path (str): The path to the file.
+        sample_size (int, optional): The number of bytes to sample, -1 reads the whole file.
 
     Returns:
         str: The detected encoding.
     """
     with open(file_path, 'rb') as file:
-        raw_data = file.read()
-    result = chardet.detect(raw_data)
+        raw_data = file.read(sample_size)
+    for bom, encoding in _BOM_ENCODINGS:
+        if raw_data.startswith(bom):
+            return encoding
+    if raw_data and raw_data.isascii():
+        return 'utf-8'
+    result = detect_charset(raw_data)
     return result['encoding']
 
 
@@ -75,32 +102,52 @@ def load_and_split_messages(log_file_path):
         - selected_messages (list of tuple): A list of tuples where each tuple contains an index and a log message from the selected subset (first 2000 messages).
         - remaining_messages (list of tuple): A list of tuples where each tuple contains an index and a log message from the remaining messages.
 
-    The log messages are read from the file, shuffled randomly, and split into two parts if the total number of messages is at least 4000.
+    The log messages are streamed from the file and 2000 of them are drawn uniformly at random with reservoir sampling,
+    if the total number of messages is at least 4000. Otherwise all messages are selected in file order.
     Each message is paired with its original index in the file.
     """
-    found_encoding = detect_encoding(log_file_path)
+    try:
+        selected_messages, remaining_messages = sample_messages(log_file_path, detect_encoding(log_file_path))
+    except UnicodeDecodeError:
+        # The sample did not show every byte of the file, so the encoding is detected on all of it
+        selected_messages, remaining_messages = sample_messages(log_file_path, detect_encoding(log_file_path, -1))
 
-    with open(log_file_path, 'r', encoding=found_encoding) as file:
-        log_text = file.readlines()
+    total_messages = len(selected_messages) + len(remaining_messages)
 
-    total_messages = len(log_text)
-    
     if total_messages < 4000:
         # If there are fewer than 4000 messages, do not split them
-        selected_messages = [(i, log_text[i]) for i in range(total_messages)]
+        selected_messages = sorted(selected_messages + remaining_messages)
         remaining_messages = []
-    else:
-        indices = list(range(total_messages))
-        random.shuffle(indices)
-        
-        selected_indices = indices[:2000]
-        remaining_indices = indices[2000:]
-        
-        selected_messages = [(i, log_text[i]) for i in selected_indices]
-        remaining_messages = [(i, log_text[i]) for i in remaining_indices]
 
     return selected_messages, remaining_messages
 
+def sample_messages(log_file_path, encoding):
+    """
+    Streams log messages from a file and draws 2000 of them uniformly at random with reservoir sampling.
+
+    Args:
+    log_file_path (str): The path to the log file.
+    encoding (str): The encoding the file is read with.
+
+    Returns:
+    tuple: The sampled messages and the remaining messages, both as lists of (index, message) tuples.
+    """
+    selected_messages = []
+    remaining_messages = []
+    with open(log_file_path, 'r', encoding=encoding) as file:
+        for i, line in enumerate(file):
+            if i < 2000:
+                selected_messages.append((i, line))
+                continue
+            # Algorithm R: the new message replaces a random reservoir entry with probability 2000 / (i + 1)
+            j = random.randrange(i + 1)
+            if j < 2000:
+                remaining_messages.append(selected_messages[j])
+                selected_messages[j] = (i, line)
+            else:
+                remaining_messages.append((i, line))
+    return selected_messages, remaining_messages
+
 def determine_delimiter(log_messages):
     """
     Determine the delimiter used in the messages based on the presence of defined special characters.
@@ -116,12 +163,17 @@ def determine_delimiter(log_messages):
     semicolon_count = 0
     total_messages = len(log_messages)
     
-    for log_message in log_messages:
-        if log_message.count("|") >= 3:
+    for i, log_message in enumerate(log_messages, start=1):
+        if "|" in log_message and log_message.count("|") >= 3:
             pipe_count += 1
-        if log_message.count(";") >= 3:
+        if ";" in log_message and log_message.count(";") >= 3:
             semicolon_count += 1
-    
+        # Stop early once neither delimiter can reach 80% of the messages anymore
+        if i % 512 == 0:
+            remaining = total_messages - i
+            if (pipe_count + remaining) / total_messages < 0.8 and (semicolon_count + remaining) / total_messages < 0.8:
+                return None
+
     if pipe_count / total_messages >= 0.8:
         return "|"
     elif semicolon_count / total_messages >= 0.8:
@@ -177,7 +229,7 @@ def _process_combined_part(combined_part, values_to_columns_list):
     clean_combine = clean_text_special_signs(combined_part)
 
     # Looking for weekday or month match
-    if any(re.search(rf'\b{day}\b', clean_combine) for day in weekdays) or any(re.search(rf'\b{month}\b', clean_combine) for month in months):
+    if _DOW_MONTH_RE.search(clean_combine):
         values_to_columns_list.extend(combined_part.split())
     else:
         values_to_columns_list.append(combined_part)
@@ -202,8 +254,8 @@ def handle_parsed_parts(message_parts):
 
     for i, part in enumerate(message_parts):
         part = part.strip()
-        if part.strip().startswith("*") and values_to_columns_list:
-            values_to_columns_list[-1] += " " + part.strip()
+        if part.startswith("*") and values_to_columns_list:
+            values_to_columns_list[-1] += " " + part
         elif "[" in part and "]" not in part:
             if combined_part is None:
                 combined_part = part
@@ -225,6 +277,32 @@ def handle_parsed_parts(message_parts):
     return values_to_columns_list
 
 
+def _split_plain_messages(plain_messages, rows, table, num_columns, delimiter):
+    """
+    Splits messages without brackets or '*' continuations into the value table with vectorized string methods.
+
+    Args:
+        plain_messages (list): The messages to split.
+        rows (np.ndarray): The row positions of the messages in the value table.
+        table (np.ndarray): The (messages, columns) object array to fill.
+        num_columns (int): The number of columns of the output.
+        delimiter (str or None): The delimiter to split the messages, whitespace if None.
+    """
+    split_parts = pd.Series(plain_messages, dtype=object).str.split(delimiter or None, n=num_columns - 1, expand=True, regex=False)
+    for position, parts in split_parts.items():
+        if delimiter:
+            parts = parts.str.strip()
+        if position == num_columns - 1:
+            # The remainder is joined by single spaces, as the parts of the last column are for other messages
+            if delimiter:
+                parts = parts.map(lambda rest: ' '.join(part.strip() for part in rest.split(delimiter)), na_action='ignore')
+            else:
+                parts = parts.map(lambda rest: ' '.join(rest.split()), na_action='ignore')
+        values = parts.to_numpy(dtype=object)
+        values[pd.isna(values)] = None
+        table[rows, position] = values
+
+
 def process_data(messages, num_columns=13, delimiter=None):
     """
     Processes a list of messages into a DataFrame with a specified number of columns.
@@ -240,21 +318,28 @@ def process_data(messages, num_columns=13, delimiter=None):
     if delimiter is None:
         delimiter = determine_delimiter(messages)
     
-    data = {f'Col_{i}': [None] * len(messages) for i in range(1, num_columns + 1)}
-    
-    for index, message in enumerate(messages):
+    table = np.full((len(messages), num_columns), None, dtype=object)
+
+    # Messages without brackets or '*' continuations need no part merging and are split all at once
+    is_plain = np.fromiter(
+        (num_columns > 1 and '[' not in message and '*' not in message for message in messages),
+        dtype=bool, count=len(messages)
+    )
+    plain_rows = np.flatnonzero(is_plain)
+    if len(plain_rows):
+        _split_plain_messages([messages[i] for i in plain_rows], plain_rows, table, num_columns, delimiter)
+
+    for index in np.flatnonzero(~is_plain):
+        message = messages[index]
         parts = split_message(message, delimiter)
         parsed_parts = handle_parsed_parts(parts)
-        
-        index_sloupce = 1
-        for part in parsed_parts[:num_columns]: 
-            data[f'Col_{index_sloupce}'][index] = part.strip()
-            index_sloupce += 1
 
+        row = [part.strip() for part in parsed_parts[:num_columns]]
         if len(parsed_parts) > num_columns - 1:
-            data[f'Col_{num_columns}'][index] = ' '.join(parsed_parts[num_columns - 1:]) 
+            row[num_columns - 1] = ' '.join(parsed_parts[num_columns - 1:])
+        table[index, :len(row)] = row
 
-    df = pd.DataFrame(data)
+    df = pd.DataFrame(table, columns=[f'Col_{i}' for i in range(1, num_columns + 1)])
     df = df.dropna(axis=1, how='all')
 
     return df, delimiter
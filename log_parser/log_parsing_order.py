@@ -1,7 +1,8 @@
 import os
 import json
+import functools
 import pandas as pd
-from utils import load_json, drop_empty_columns
+from utils import load_json, drop_empty_columns, compile_alternation
 
 from process_columns import (
     process_column_contains_word,
@@ -21,6 +22,50 @@ from pid_tid_component_processing import (
 )
 from process_first_column import rename_first_column
 
+
+@functools.lru_cache(maxsize=32)
+def _load_json_values(path):
+    """
+    Loads the values of a JSON file once per path and keeps them for later calls.
+
+    The values are returned as tuples, so the cached data cannot be modified by the callers.
+
+    Args:
+        path (str): The path to the JSON file.
+
+    Returns:
+        tuple: The values from the JSON file.
+    """
+    with open(path, 'r', encoding='utf-8') as file:
+        data = json.load(file)
+        if isinstance(data, dict):
+            values = list(data.values())
+            if len(values) == 1 and isinstance(values[0], list):
+                return tuple(values[0])
+            return tuple(values)
+        if isinstance(data, list):
+            return tuple(data)
+        return data
+
+
+_BASE_DIR = os.path.dirname(os.path.dirname(__file__))
+_JSON_PATHS = {
+    'level': os.path.join(_BASE_DIR, 'data', 'level_values.json'),
+    'month': os.path.join(_BASE_DIR, 'data', 'month_values.json'),
+    'weekday': os.path.join(_BASE_DIR, 'data', 'weekday_values.json'),
+    'program': os.path.join(_BASE_DIR, 'data', 'program_values.json'),
+    'user': os.path.join(_BASE_DIR, 'data', 'user_values.json'),
+    'node': os.path.join(_BASE_DIR, 'data', 'node_values.json'),
+    'state': os.path.join(_BASE_DIR, 'data', 'state_values.json'),
+    'flag': os.path.join(_BASE_DIR, 'data', 'flag_values.json'),
+    'type': os.path.join(_BASE_DIR, 'data', 'type_values.json')
+}
+_VALUES = {key: _load_json_values(path) for key, path in _JSON_PATHS.items()}
+# Sets for exact membership checks and alternations for substring searches
+_VALUE_SETS = {key: frozenset(values) for key, values in _VALUES.items()}
+_VALUE_PATTERNS = {key: compile_alternation(values) for key, values in _VALUES.items()}
+
+
 class LogParsingOrder:
     """
     A class used to structure logs in a DataFrame by applying a series of processing functions.
@@ -49,16 +94,13 @@ class LogParsingOrder:
         self.df = df
         self.functions_needed = []
         self.flag = 0
+        # Cleaned date/time candidate columns, shared by all process_time_date_columns calls
+        self._dt_cache = {}
+        # Cleaned candidate columns, shared by all process_column_contains_* calls
+        self._word_cache = {}
 
     def load_json_values(self, path):
-        with open(path, 'r', encoding='utf-8') as file:
-            data = json.load(file)
-            if isinstance(data, dict):
-                values = list(data.values())
-                if len(values) == 1 and isinstance(values[0], list):
-                    return values[0]
-                return values
-            return data
+        return _load_json_values(path)
 
     def append_function(self, condition, func, kwargs=None):
         """
@@ -85,36 +127,19 @@ class LogParsingOrder:
             int: The flag indicating the number of special conditions met.
             list: The list of functions needed for further processing.
         """
-        base_dir = os.path.dirname(os.path.dirname(__file__))
-        
-        json_paths = {
-            'level': os.path.join(base_dir, 'data', 'level_values.json'),
-            'month': os.path.join(base_dir, 'data', 'month_values.json'),
-            'weekday': os.path.join(base_dir, 'data', 'weekday_values.json'),
-            'program': os.path.join(base_dir, 'data', 'program_values.json'),
-            'user': os.path.join(base_dir, 'data', 'user_values.json'),
-            'node': os.path.join(base_dir, 'data', 'node_values.json'),
-            'state': os.path.join(base_dir, 'data', 'state_values.json'),
-            'flag': os.path.join(base_dir, 'data', 'flag_values.json'),
-            'type': os.path.join(base_dir, 'data', 'type_values.json')
-        }
-
-        #values = {key: self.load_json_values(path) for key, path in json_paths.items()}
-
-        values = {key: self.load_json_values(path) for key, path in json_paths.items()}
-
-        self.df = process_column_contains_only_word(self.df, values['level'], threshold=0.8, new_column_name='level')
+        self.df = process_column_contains_only_word(self.df, _VALUE_SETS['level'], threshold=0.8, new_column_name='level', cleaned_cache=self._word_cache)
 
-        self.df, flag_time1 = process_time_date_columns(self.df, column_type='time')
+        self.df, flag_time1 = process_time_date_columns(self.df, column_type='time', cleaned_cache=self._dt_cache)
         self.append_function(flag_time1, 'process_time_date_columns', {'finder_class': TimeFinderPlural, 'column_type': 'time'})
 
-        self.df = process_column_contains_only_word(self.df, values['month'], threshold=0.8, new_column_name='month')
-        self.df = process_column_contains_only_word(self.df, values['weekday'], threshold=0.8, new_column_name='weekday')
-        self.df = find_and_process_day_column(self.df)
-        self.df = find_and_process_year_column(self.df)
+        self.df = process_column_contains_only_word(self.df, _VALUE_SETS['month'], threshold=0.8, new_column_name='month', cleaned_cache=self._word_cache)
+        self.df = process_column_contains_only_word(self.df, _VALUE_SETS['weekday'], threshold=0.8, new_column_name='weekday', cleaned_cache=self._word_cache)
+        candidate_scores = {}
+        self.df = find_and_process_day_column(self.df, candidate_scores)
+        self.df = find_and_process_year_column(self.df, candidate_scores)
         self.df = process_utc_timestamps(self.df)
 
-        self.df, flag_date1 = process_time_date_columns(self.df, column_type='date')
+        self.df, flag_date1 = process_time_date_columns(self.df, column_type='date', cleaned_cache=self._dt_cache)
         self.append_function(flag_date1, 'process_time_date_columns', {'finder_class': DateFinderPlural, 'column_type': 'date'})
 
         self.df = process_time_date_no_sep_columns(self.df)
@@ -126,23 +151,23 @@ class LogParsingOrder:
         self.append_function(flag_pid, process_pid_column)
         
         self.df = process_pid_tid_columns(self.df)
-        self.df = process_column_contains_word(self.df, values['program'], threshold=0.8, new_column_name='program')
-        self.df = process_column_contains_word(self.df, values['user'], threshold=0.4, new_column_name='user')
-        self.df = process_column_contains_pattern_word(self.df, values['node'], threshold=0.4, new_column_name='node')
-        self.df = process_column_contains_pattern_word(self.df, values['node'], threshold=0.4, new_column_name='node_repeat')
+        self.df = process_column_contains_word(self.df, _VALUE_PATTERNS['program'], threshold=0.8, new_column_name='program', cleaned_cache=self._word_cache)
+        self.df = process_column_contains_word(self.df, _VALUE_PATTERNS['user'], threshold=0.4, new_column_name='user', cleaned_cache=self._word_cache)
+        self.df = process_column_contains_pattern_word(self.df, _VALUE_PATTERNS['node'], threshold=0.4, new_column_name='node', cleaned_cache=self._word_cache)
+        self.df = process_column_contains_pattern_word(self.df, _VALUE_PATTERNS['node'], threshold=0.4, new_column_name='node_repeat', cleaned_cache=self._word_cache)
         self.df = process_component_column_by_prefix(self.df)
-        self.df = process_column_contains_only_word(self.df, values['type'], threshold=0.4, new_column_name='type')
-        self.df = process_column_contains_only_word(self.df, values['flag'], threshold=0.8, new_column_name='flag')
-        self.df = process_column_contains_word(self.df, values['state'], threshold=0.5, new_column_name='state')
+        self.df = process_column_contains_only_word(self.df, _VALUE_SETS['type'], threshold=0.4, new_column_name='type', cleaned_cache=self._word_cache)
+        self.df = process_column_contains_only_word(self.df, _VALUE_SETS['flag'], threshold=0.8, new_column_name='flag', cleaned_cache=self._word_cache)
+        self.df = process_column_contains_word(self.df, _VALUE_PATTERNS['state'], threshold=0.5, new_column_name='state', cleaned_cache=self._word_cache)
         self.df = process_component_column_by_position(self.df, 'state')
         
         self.df = rename_first_column(self.df)
         self.df = process_column_addr(self.df)
         self.df = process_column_location(self.df)
         
-        self.df, flag_time2 = process_time_date_columns(self.df, column_type='time')
+        self.df, flag_time2 = process_time_date_columns(self.df, column_type='time', cleaned_cache=self._dt_cache)
         self.append_function(flag_time2, 'process_time_date_columns', {'finder_class': TimeFinderPlural, 'column_type': 'time'})
-        self.df, flag_date2 = process_time_date_columns(self.df, column_type='date')
+        self.df, flag_date2 = process_time_date_columns(self.df, column_type='date', cleaned_cache=self._dt_cache)
         self.append_function(flag_date2, 'process_time_date_columns', {'finder_class': DateFinderPlural, 'column_type': 'date'})
         self.df = drop_empty_columns(self.df)
         self.df = merge_columns_to_content(self.df)
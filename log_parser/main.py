@@ -1,18 +1,31 @@
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import numpy as np
 import pandas as pd
 from log_parsing_order import LogParsingOrder
 from log_message_processing import process_data, load_and_split_messages
-from utils import remove_columns_with_special_characters, remove_trailing_characters
+from utils import remove_columns_with_special_characters, remove_trailing_characters_vec
 from date_time_processing import process_time_date_columns
 from pid_tid_component_processing import process_component_column_by_pattern, process_pid_column
 
 
-def apply_functions_to_dataframe(df, functions):
+# Functions whose detection decisions are fully visible in the columns and flags they return
+_DECISIONS_IN_RESULT = {process_component_column_by_pattern, process_pid_column}
+# Functions that also pick a finder, which they report through their decisions argument
+_DECISIONS_REPORTED = {process_time_date_columns}
+
+
+def apply_functions_to_dataframe(df, functions, decisions=None):
     """
     Applies a list of functions to a DataFrame sequentially.
 
     Args:
         df (pd.DataFrame): The input DataFrame.
         functions (list): List of functions where each function accepts a DataFrame as input.
+        decisions (list, optional): If given, the decisions each function made are appended to it: the columns
+            and flags it ended with, plus the finders it picked for functions that report them.
 
     Returns:
         pd.DataFrame: The DataFrame after applying all functions in the list.
@@ -21,17 +34,72 @@ def apply_functions_to_dataframe(df, functions):
         if isinstance(func, tuple):
             func_name, kwargs = func[0], func[1]
             func = globals()[func_name]  
-            result = func(df, **kwargs)
         else:
-            result = func(df)
+            kwargs = {}
+        reported = []
+        if decisions is not None and func in _DECISIONS_REPORTED:
+            kwargs = dict(kwargs, decisions=reported)
+        result = func(df, **kwargs)
         
         if isinstance(result, tuple):
             df = result[0]  
         else:
             df = result
+        if decisions is not None:
+            decisions.append((list(df.columns), result[1:] if isinstance(result, tuple) else (), reported))
     
     return df
 
+
+def _apply_functions_to_chunk(df, functions):
+    """
+    Applies a list of functions to a row chunk and returns it together with the detection decisions made on it.
+    """
+    decisions = []
+    df = apply_functions_to_dataframe(df, functions, decisions)
+    return df, decisions
+
+# Smallest number of remaining rows handed to one worker process, smaller inputs are processed serially.
+_MIN_ROWS_PER_WORKER = 50000
+
+
+def apply_functions_in_parallel(df, functions):
+    """
+    Applies a list of functions to row chunks of a DataFrame in worker processes.
+
+    Every function detects its columns again on each chunk, so the chunks are only combined when
+    all of them made the same decisions: the same columns, flags and picked finders after every
+    function. The detections pick the first column and finder over a threshold of per-column hit
+    rates, so when every chunk agrees the whole DataFrame decides the same way. Lists with a function
+    whose decisions are not fully recorded, or a worker pool that breaks down, are processed serially.
+
+    Args:
+        df (pd.DataFrame): The input DataFrame.
+        functions (list): List of functions where each function accepts a DataFrame as input.
+
+    Returns:
+        pd.DataFrame: The DataFrame after applying all functions in the list.
+    """
+    workers = min(os.cpu_count() or 1, len(df) // _MIN_ROWS_PER_WORKER)
+    recorded = all((globals()[func[0]] if isinstance(func, tuple) else func) in _DECISIONS_IN_RESULT | _DECISIONS_REPORTED
+                   for func in functions)
+    if workers < 2 or not recorded:
+        return apply_functions_to_dataframe(df, functions)
+
+    bounds = np.linspace(0, len(df), workers + 1, dtype=int)
+    chunks = [df.iloc[start:stop] for start, stop in zip(bounds[:-1], bounds[1:])]
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_apply_functions_to_chunk, chunks, [functions] * workers))
+    except (BrokenProcessPool, pickle.PicklingError):
+        return apply_functions_to_dataframe(df, functions)
+
+    processed_chunks, chunk_decisions = zip(*results)
+    if any(decisions != chunk_decisions[0] for decisions in chunk_decisions[1:]):
+        return apply_functions_to_dataframe(df, functions)
+    return pd.concat(processed_chunks)
+
+
 def log_parser(log_file_path):
     """
     Process the log file and return a structured DataFrame.
@@ -43,8 +111,8 @@ def log_parser(log_file_path):
         pd.DataFrame: The cleaned DataFrame.
     """
     training_messages, remaining_messages = load_and_split_messages(log_file_path)
-    training_message_texts = [msg for _, msg in training_messages]
-    training_df, found_delimiter = process_data(training_message_texts, num_columns=13)
+    training_indices, training_message_texts = zip(*training_messages) if training_messages else ((), ())
+    training_df, found_delimiter = process_data(list(training_message_texts), num_columns=13)
     training_df_log_structurer = LogParsingOrder(training_df)
     structured_training_df, cols_added_num, used_functions = training_df_log_structurer.structure_logs()
     
@@ -53,20 +121,24 @@ def log_parser(log_file_path):
 
     if remaining_messages:
         remaining_df_cols_num = structured_training_df_col_count - cols_added_num 
-        remaining_message_texts = [msg for _, msg in remaining_messages]
-        remaining_df, remaining_df_delimiter = process_data(remaining_message_texts, num_columns=remaining_df_cols_num, delimiter=found_delimiter)
-        processed_remaining_df = apply_functions_to_dataframe(remaining_df, used_functions)
+        remaining_indices, remaining_message_texts = zip(*remaining_messages)
+        remaining_df, remaining_df_delimiter = process_data(list(remaining_message_texts), num_columns=remaining_df_cols_num, delimiter=found_delimiter)
+        processed_remaining_df = apply_functions_in_parallel(remaining_df, used_functions)
         processed_remaining_df.columns = structured_training_df_col_names
-        structured_training_df['Original_Index'] = [idx for idx, _ in training_messages]
-        processed_remaining_df['Original_Index'] = [idx for idx, _ in remaining_messages]
-        df_combined = pd.concat([structured_training_df, processed_remaining_df])
-        df_combined = df_combined.sort_values('Original_Index').reset_index(drop=True)
-        df_combined = df_combined.drop(columns=['Original_Index'])
+        # The original line indices are a permutation of all rows, so the rows are put back in file order
+        # by scattering their positions instead of sorting
+        original_indices = np.asarray(training_indices + remaining_indices, dtype=np.int64)
+        row_order = np.empty(len(original_indices), dtype=np.int64)
+        row_order[original_indices] = np.arange(len(original_indices))
+        df_combined = pd.concat([structured_training_df, processed_remaining_df], ignore_index=True)
+        df_combined = df_combined.take(row_order).reset_index(drop=True)
     else:
         df_combined = structured_training_df.copy()
 
     df_combined = remove_columns_with_special_characters(df_combined)
-    df_cleaned = df_combined.map(remove_trailing_characters)
+    df_cleaned = df_combined.copy()
+    for position in range(df_combined.shape[1]):
+        df_cleaned.isetitem(position, remove_trailing_characters_vec(df_combined.iloc[:, position]))
     return df_cleaned
 
 
@@ -78,3 +150,5 @@ def main():
     df_cleaned = log_parser(args.log_file_path)
 
 
+if __name__ == '__main__':
+    main()
@@ -1,8 +1,15 @@
 import re
 import pandas as pd
-from collections import Counter
-from utils import lower_strip_text, matches_pattern, is_only_numeric, is_only_special, remove_numbers_and_brackets
-import warnings
+from utils import lower_strip_text_vec, is_only_numeric_vec, is_only_special_vec, remove_numbers_and_brackets_vec
+
+_COMPONENT_PATTERN = re.compile(r'(?<=[a-zA-Z\-:_\)\]\}][@\[:])\d+(?=(?:\]:|\:\]|\:$|\]$|$))|.+:$')
+_PID_PATTERN = re.compile(r'(?<=[a-zA-Z0-9\-:_\)\]\}][@\[:])\d+(?=(?:\]:|\:\]|\:$|\]$|$))')
+# The pid together with surrounding whitespace, removed from the component in one pass
+_PID_STRIP_PATTERN = re.compile(_PID_PATTERN.pattern + r'|^\s+|\s+$')
+# The last run of digits, matched on the reversed text: anchored at the start, so a single linear scan
+_REVERSED_LAST_DIGITS_PATTERN = re.compile(r'^\D*(?P<pid>\d+)')
+_UPPER_SEPARATOR_PATTERN = re.compile(r'[A-Z].*[A-Z]')
+_UPPER_PREFIX_PATTERN = re.compile(r'^([A-Z][a-z]*)(?=[A-Z])')
 
 def process_component_column_by_pattern(df):
     """
@@ -19,12 +26,11 @@ def process_component_column_by_pattern(df):
         pd.DataFrame: The DataFrame with the column renamed to 'component', if a matching column is found.
     """
     candidate_columns = [col for col in df.columns[1:] if 'Col_' in col and 'Col_13' not in col] 
-    pattern_component = r'(?<=[a-zA-Z\-:_\)\]\}][@\[:])\d+(?=(\]:|\:\]|\:$|\]$|$))|.+:$'
     for column in candidate_columns:
-        lowercase_values = df[column].apply(lower_strip_text)
-        matching_pattern_sum = lowercase_values.apply(lambda x: matches_pattern(x, pattern_component)).sum()
+        lowercase_values = lower_strip_text_vec(df[column])
+        matching_pattern_sum = lowercase_values.str.contains(_COMPONENT_PATTERN).sum()
         if matching_pattern_sum / len(lowercase_values) >= 0.8:
-            df = df.rename(columns={column: 'component'})
+            df.rename(columns={column: 'component'}, inplace=True)
             break
     return df
 
@@ -47,10 +53,11 @@ def process_component_column_by_position(df, specified_column):
     if 'component' not in df.columns and specified_column in df.columns:
         candidate_columns = [col for col in df.columns[1:] if 'Col_' in col and 'Col_13' not in col]
         info_index = df.columns.get_loc(specified_column)
+        neighbors = {df.columns[i] for i in (info_index - 1, info_index + 1) if 0 <= i < len(df.columns)}
         for col in candidate_columns:
-            if df.columns.get_loc(col) == info_index - 1 or df.columns.get_loc(col) == info_index + 1:
-                if not df[col].apply(lambda x: is_only_numeric(x) or is_only_special(x)).any():
-                    df = df.rename(columns={col: 'component'})
+            if col in neighbors:
+                if not (is_only_numeric_vec(df[col]) | is_only_special_vec(df[col])).any():
+                    df.rename(columns={col: 'component'}, inplace=True)
                     break
     return df
 
@@ -73,13 +80,13 @@ def process_component_column_by_prefix(df):
     for column in candidate_columns:
         separator = determine_separator_in_column(df[column])
         if separator:
-            prefixes = df[column].dropna().apply(lambda x: extract_prefix(x, separator))
-            non_numeric_prefixes = [prefix for prefix in prefixes if prefix and not prefix.isdigit()]
-            prefix_counts = Counter(non_numeric_prefixes)
-            common_prefixes = [prefix for prefix, count in prefix_counts.items() if count / len(df) >= 0.08]
+            prefixes = extract_prefixes(df[column].dropna(), separator).dropna()
+            non_numeric_prefixes = prefixes[(prefixes != '') & ~prefixes.str.isdigit().astype(bool)]
+            prefix_counts = non_numeric_prefixes.value_counts()
+            common_prefix_counts = prefix_counts[prefix_counts / len(df) >= 0.08]
 
-            if len(common_prefixes) <= 10 and sum(prefix_counts[prefix] for prefix in common_prefixes) / len(df) >= 0.8:
-                df = df.rename(columns={column: 'component'})
+            if len(common_prefix_counts) <= 10 and common_prefix_counts.sum() / len(df) >= 0.8:
+                df.rename(columns={column: 'component'}, inplace=True)
                 break
 
     return df
@@ -94,54 +101,36 @@ def determine_separator_in_column(column):
     Returns:
         str: The most common separator ('_', '.', or 'upper').
     """
-    separators = {'_': 0, '.': 0, 'upper': 0}
-    
-    for value in column.dropna():
-        if '_' in value:
-            separators['_'] += 1
-        elif '.' in value:
-            separators['.'] += 1
-        elif re.match(r'[A-Z].*[A-Z]', value):
-            separators['upper'] += 1
-    
+    values = column.dropna()
+    if values.empty:
+        return None
+
+    # the checks take priority in this order, each value is counted at most once
+    has_underscore = values.str.contains('_', regex=False, na=False)
+    has_dot = ~has_underscore & values.str.contains('.', regex=False, na=False)
+    has_upper = ~has_underscore & ~has_dot & values.str.match(_UPPER_SEPARATOR_PATTERN, na=False)
+    separators = {'_': int(has_underscore.sum()), '.': int(has_dot.sum()), 'upper': int(has_upper.sum())}
+
     most_common_separator = max(separators, key=separators.get)
     return most_common_separator if separators[most_common_separator] > 0 else None
 
-def extract_prefix(value, separator):
+def extract_prefixes(values, separator):
     """
-    Extract the prefix from the value based on a specific separator.
+    Extract the prefix of every value of a Series based on a specific separator, using vectorized string operations.
     
     Args:
-        value (str): The value from which to extract the prefix.
-        separator (str): The separator to use for extracting the prefix.
+        values (pd.Series): The values from which to extract the prefixes.
+        separator (str): The separator to use for extracting the prefixes.
     
     Returns:
-        str: The extracted prefix or None if no prefix is found.
-    """
-    if separator == '_':
-        return value.split('_')[0]
-    elif separator == '.':
-        return value.split('.')[0]
-    elif separator == 'upper':
-        match = re.match(r'^([A-Z][a-z]*)(?=[A-Z])', value)
-        if match:
-            return match.group(1)
-    return None
-
-
-def _extract_pid(text):
+        pd.Series: The extracted prefixes, NaN where no prefix is found.
     """
-    Extracts the pid from the given text based on a pattern.
-    
-    Args:
-        text (str): The input text from which pid needs to be extracted.
-        
-    Returns:
-        str: The extracted pid or None if no pattern is matched.
-    """
-    pattern = r'(?P<pid>\d+)'
-    matches = re.findall(pattern, text)
-    return matches[-1] if matches else ''
+    if separator in ('_', '.'):
+        return values.str.split(separator, n=1).str[0]
+    if separator == 'upper':
+        return values.str.extract(_UPPER_PREFIX_PATTERN, expand=False)
+    return pd.Series(None, index=values.index, dtype=object)
+
 
 def process_pid_column(df):
     """
@@ -158,21 +147,23 @@ def process_pid_column(df):
     Returns:
         pd.DataFrame: The modified DataFrame with a new 'pid' column if applicable.
     """
-    PATTERN_PID = r'(?<=[a-zA-Z0-9\-:_\)\]\}][@\[:])\d+(?=(\]:|\:\]|\:$|\]$|$))'
     flag = 0
     if 'component' in df.columns:
         total_rows = len(df)
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore", UserWarning)
-            rows_with_pid = df['component'].str.contains(PATTERN_PID, na=False).sum()
+        has_pid = df['component'].str.contains(_PID_PATTERN, na=False)
+        rows_with_pid = has_pid.sum()
 
         if rows_with_pid / total_rows >= 0.1:
-            df['pid'] = df['component'].apply(lambda x: _extract_pid(x) if x is not None and re.search(PATTERN_PID, x) else '')
-            df['component'] = df['component'].str.replace(PATTERN_PID, '', regex=True).str.strip()
+            # The last run of digits in each matching value, found as the first run in the reversed value
+            reversed_values = df.loc[has_pid, 'component'].str[::-1]
+            last_digits = reversed_values.str.extract(_REVERSED_LAST_DIGITS_PATTERN, expand=False).str[::-1]
+            df['pid'] = ''
+            df.loc[last_digits.index, 'pid'] = last_digits
+            df['component'] = df['component'].str.replace(_PID_STRIP_PATTERN, '', regex=True)
             idx = df.columns.get_loc('component') + 1
             df.insert(idx, 'pid', df.pop('pid'))
-            df['component'] = df['component'].apply(remove_numbers_and_brackets)
-            df['pid'] = df['pid'].apply(remove_numbers_and_brackets)
+            df['component'] = remove_numbers_and_brackets_vec(df['component'])
+            df['pid'] = remove_numbers_and_brackets_vec(df['pid'])
             flag = 1
     #else:
     #    candidate_columns = [col for col in df.columns[1:] if 'Col_' in col and 'Col_13' not in col]
@@ -210,27 +201,28 @@ def process_pid_tid_columns(df):
     numerical_columns = []
     
     for column in candidate_columns:
-        if df[column].apply(lambda x: pd.to_numeric(x, errors='coerce')).notna().sum() / len(df) >= 0.8:
-            if df[column].apply(lambda x: pd.to_numeric(x, errors='coerce')).dropna().astype(int).ge(10).all():
+        numeric_values = pd.to_numeric(df[column], errors='coerce')
+        if numeric_values.notna().sum() / len(df) >= 0.8:
+            if numeric_values.dropna().astype(int).ge(10).all():
                 numerical_columns.append(column)
 
     if len(numerical_columns) == 1:
-        df = df.rename(columns={numerical_columns[0]: 'pid'})
+        df.rename(columns={numerical_columns[0]: 'pid'}, inplace=True)
     elif ('date' in df.columns and 'time' in df.columns) or ('day' in df.columns and 'time' in df.columns):
         for i, column in enumerate(numerical_columns):
             if 'Col_' in column:
                 if i == 0:
-                    df = df.rename(columns={column: 'pid'})
+                    df.rename(columns={column: 'pid'}, inplace=True)
                 elif i == 1:
-                    df = df.rename(columns={column: 'tid'})
+                    df.rename(columns={column: 'tid'}, inplace=True)
                 if i >= 1:
                     break
     else:
         for i, column in enumerate(numerical_columns):
             if i == 0:
-                df = df.rename(columns={column: 'pid'})
+                df.rename(columns={column: 'pid'}, inplace=True)
             elif i == 1:
-                df = df.rename(columns={column: 'tid'})
+                df.rename(columns={column: 'tid'}, inplace=True)
             if i >= 1:
                 break
 
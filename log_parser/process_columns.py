@@ -1,17 +1,29 @@
 import re
 import pandas as pd
-from utils import clean_text_special_signs, contains_any, remove_trailing_characters
+from utils import cached_clean_text_special_signs, compile_alternation, remove_trailing_characters
+
+_SPECIAL_RE = re.compile(r'^(?=.*[A-Z].*[A-Z])(?=.*[0-9].*[0-9])[A-Z0-9]+([\-:][A-Z0-9]+)*$')
+_ADDR_RE = re.compile(r'\[\s*(?:-|\w[\w\s-]*)\s*\]')
+
+
+def _contains_any_values(values, strings):
+    """
+    Check which values contain any of the strings, with a single regex search per value.
+    """
+    pattern = strings if isinstance(strings, re.Pattern) else compile_alternation(strings)
+    return values.str.contains(pattern, na=False)
 
 # used for user, weekday, month 
-def process_column_contains_word(df, strings, threshold, new_column_name):
+def process_column_contains_word(df, strings, threshold, new_column_name, cleaned_cache=None):
     """
     Rename the first column containing any of the strings provided in the list to a new column name.
 
     Args:
     - df: DataFrame, the input DataFrame.
-    - strings: list of strings, the list of strings to search for in the DataFrame columns.
+    - strings: list of strings or a compiled alternation of them (see utils.compile_alternation), the strings to search for in the DataFrame columns.
     - threshold: float, the threshold percentage of matching strings required to trigger the rename.
     - new_column_name: str, the new name to assign to the column.
+    - cleaned_cache: dict, optional, cleaned columns shared between calls (see utils.cached_clean_text_special_signs).
 
     Returns:
     - df: DataFrame, the DataFrame with the renamed column if conditions are met.
@@ -19,23 +31,24 @@ def process_column_contains_word(df, strings, threshold, new_column_name):
     candidate_columns = [col for col in df.columns[1:] if 'Col_' in col and 'Col_13' not in col]
 
     for column in candidate_columns:
-        lowercase_values = df[column].apply(clean_text_special_signs)
-        if lowercase_values.apply(lambda x: contains_any(x, strings)).mean() >= threshold:
-            df = df.rename(columns={column: new_column_name})
+        lowercase_values = cached_clean_text_special_signs(df[column], cleaned_cache)
+        if _contains_any_values(lowercase_values, strings).mean() >= threshold:
+            df.rename(columns={column: new_column_name}, inplace=True)
             df[new_column_name] = df[new_column_name].apply(remove_trailing_characters)
             break
     return df
 
 # used for user, weekday, month 
-def process_column_contains_only_word(df, strings, threshold, new_column_name):
+def process_column_contains_only_word(df, strings, threshold, new_column_name, cleaned_cache=None):
     """
     Rename the first column containing any of the strings provided in the list to a new column name.
 
     Args:
     - df: DataFrame, the input DataFrame.
-    - strings: list of strings, the list of strings to search for in the DataFrame columns.
+    - strings: list or set of strings, the strings to search for in the DataFrame columns.
     - threshold: float, the threshold percentage of matching strings required to trigger the rename.
     - new_column_name: str, the new name to assign to the column.
+    - cleaned_cache: dict, optional, cleaned columns shared between calls (see utils.cached_clean_text_special_signs).
 
     Returns:
     - df: DataFrame, the DataFrame with the renamed column if conditions are met.
@@ -43,9 +56,9 @@ def process_column_contains_only_word(df, strings, threshold, new_column_name):
     candidate_columns = [col for col in df.columns if 'Col_' in col and 'Col_13' not in col]
 
     for column in candidate_columns:
-        lowercase_values = df[column].apply(clean_text_special_signs)
+        lowercase_values = cached_clean_text_special_signs(df[column], cleaned_cache)
         if lowercase_values.isin(strings).mean() >= threshold:
-            df = df.rename(columns={column: new_column_name})
+            df.rename(columns={column: new_column_name}, inplace=True)
             df[new_column_name] = df[new_column_name].apply(remove_trailing_characters)
             break
     return df
@@ -57,18 +70,29 @@ def _match_special_pattern(text):
     """
     if text is None or text == "" or isinstance(text,float):
         return False
-    pattern = re.compile(r'^(?=.*[A-Z].*[A-Z])(?=.*[0-9].*[0-9])[A-Z0-9]+([\-:][A-Z0-9]+)*$')
-    return bool(pattern.match(text)) or text in ["UNKNOWN_LOCATION", "Null"]
+    return bool(_SPECIAL_RE.match(text)) or text in ["UNKNOWN_LOCATION", "Null"]
 
-def process_column_contains_pattern_word(df, strings, threshold, new_column_name):
+
+def _match_special_pattern_values(values):
+    """
+    Check which values match the special pattern, like `_match_special_pattern` with vectorized string operations.
+    """
+    try:
+        matches = values.str.match(_SPECIAL_RE, na=False)
+    except AttributeError:
+        return values.apply(_match_special_pattern)
+    return matches | values.isin(["UNKNOWN_LOCATION", "Null"])
+
+def process_column_contains_pattern_word(df, strings, threshold, new_column_name, cleaned_cache=None):
     """
     Rename the first column containing any of the strings provided in the list to a new column name.
 
     Args:
     - df: DataFrame, the input DataFrame.
-    - strings: list of strings, the list of strings to search for in the DataFrame columns.
+    - strings: list of strings or a compiled alternation of them (see utils.compile_alternation), the strings to search for in the DataFrame columns.
     - threshold: float, the threshold percentage of matching strings required to trigger the rename.
     - new_column_name: str, the new name to assign to the column.
+    - cleaned_cache: dict, optional, cleaned columns shared between calls (see utils.cached_clean_text_special_signs).
 
     Returns:
     - df: DataFrame, the DataFrame with the renamed column if conditions are met.
@@ -76,11 +100,10 @@ def process_column_contains_pattern_word(df, strings, threshold, new_column_name
     candidate_columns = [col for col in df.columns[1:] if 'Col_' in col and 'Col_13' not in col]
 
     for column in candidate_columns:
-        lowercase_values = df[column].apply(clean_text_special_signs)
-        match_ratio = lowercase_values.apply(lambda x: contains_any(x, strings)).sum() / len(lowercase_values)
-        special_pattern_ratio = df[column].apply(_match_special_pattern).sum() / len(df[column])
-        if match_ratio >= threshold or special_pattern_ratio >= threshold:
-            df = df.rename(columns={column: new_column_name})
+        lowercase_values = cached_clean_text_special_signs(df[column], cleaned_cache)
+        match_ratio = _contains_any_values(lowercase_values, strings).sum() / len(lowercase_values)
+        if match_ratio >= threshold or _match_special_pattern_values(df[column]).sum() / len(df[column]) >= threshold:
+            df.rename(columns={column: new_column_name}, inplace=True)
             break
     return df
 
@@ -97,13 +120,11 @@ def process_column_addr(df):
         list: A list of column names that match the criteria.
     """
 
-    pattern = re.compile(r'\[\s*(?:-|\w[\w\s-]*)\s*\]')
-
     candidate_columns = [col for col in df.columns[1:] if 'Col_' in col and 'Col_13' not in col]
 
     for column in candidate_columns:
-        if df[column].apply(lambda x: bool(pattern.match(str(x)))).sum() / len(df[column]) >= 0.8:
-            df = df.rename(columns={column: 'addr'})
+        if df[column].astype(str).str.match(_ADDR_RE).sum() / len(df[column]) >= 0.8:
+            df.rename(columns={column: 'addr'}, inplace=True)
             break
     return df
 
@@ -133,12 +154,16 @@ def process_column_location(df):
 
 
     candidate_columns = [col for col in df.columns[1:] if 'Col_' in col and 'Col_13' not in col]
+    user_values = df['user'].to_numpy()
 
     for column in candidate_columns:
-        matching_rows = df.apply(lambda row: contains_user_value(row['user'], row[column]), axis=1)
+        # the pattern can match empty before the user value, so for strings it is a plain substring check
+        matching_rows = pd.Series([user_value in cell_value if type(user_value) is str and type(cell_value) is str
+                                   else contains_user_value(user_value, cell_value)
+                                   for user_value, cell_value in zip(user_values, df[column].to_numpy())], dtype=bool)
         matching_percentage = matching_rows.mean()
         if matching_percentage >= 0.8:
-            df = df.rename(columns={column: 'location'})
+            df.rename(columns={column: 'location'}, inplace=True)
     
     return df
 
@@ -169,7 +194,8 @@ def merge_columns_to_content(df):
     if columns_to_merge.empty:
         raise ValueError("No columns found to merge after the last non-'Col_' column.")
     
-    df['Content'] = df[columns_to_merge].apply(lambda row: ' '.join([str(val) for val in row if val is not None]), axis=1).str.strip()
+    rows = df[columns_to_merge].to_numpy(dtype=object)
+    df['Content'] = [' '.join([str(val) for val in row if val is not None]).strip() for row in rows]
     
 
     df.drop(columns=columns_to_merge, inplace=True)
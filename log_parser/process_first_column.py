@@ -1,5 +1,9 @@
 import re
-from date_time_processing import DateFinderPlural, apply_finder_method
+from date_time_processing import DateFinderPlural, match_pattern_values
+from utils import is_only_special_vec
+
+_WORD_CHARACTER = re.compile(r'\w')
+_ONLY_WORDS = re.compile(r'^[\w\s]+$')
 
 def rename_first_column(df):
     """
@@ -15,24 +19,25 @@ def rename_first_column(df):
     first_column = df.columns[0]
     
     if first_column.startswith('Col_'):
-        if df[first_column].astype(str).str.isdigit().all():
+        values = df[first_column].astype(str)
+        if values.str.isdigit().all():
             df.rename(columns={first_column: 'logid'}, inplace=True)
         else:
-            contains_words = any(df[first_column].apply(lambda x: bool(re.search(r'\w', str(x)))))
+            contains_words = values.str.contains(_WORD_CHARACTER).any()
+            lowercase_values = values.str.lower()
             if contains_words:
-                lowercase_values = df[first_column].apply(lambda x: str(x).lower())
-                pattern_found = any(lowercase_values.apply(lambda x: any(apply_finder_method(finder, x, DateFinderPlural) for finder in DateFinderPlural.finders)))
+                # The union of all plural date patterns is found in a value exactly when one of the finders finds a date
+                pattern_found = match_pattern_values(lowercase_values, DateFinderPlural.union).any()
 
                 if pattern_found:
                     df.rename(columns={first_column: 'logrecord'}, inplace=True)
                 else:
-                    only_special_chars_or_words = all(lowercase_values.apply(lambda x: bool(re.match(r'^[\w\s]+$', x)) or bool(re.match(r'^[\W_]+$', x))))
+                    only_special_chars_or_words = (lowercase_values.str.match(_ONLY_WORDS) | is_only_special_vec(lowercase_values)).all()
                     if only_special_chars_or_words:
                         df.rename(columns={first_column: 'Label'}, inplace=True)
 
             else:
-                lowercase_values = df[first_column].apply(lambda x: str(x).lower())
-                only_special_chars = all(lowercase_values.apply(lambda x: bool(re.match(r'^[\W_]+$', x))))
+                only_special_chars = is_only_special_vec(lowercase_values).all()
                 if only_special_chars:
                     df.rename(columns={first_column: 'Label'}, inplace=True)
     
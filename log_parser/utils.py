@@ -3,11 +3,24 @@ Module provides additional functions for text cleaning and data manipulation.
 """
 
 import re
-from typing import Any
+from typing import Any, Callable
 import json
-import numpy as np
 import pandas as pd  
 
+_SPECIAL_SIGNS_EDGES = re.compile(r'^[\[\]:,]+|[\[\]:,]+$')
+# Leading and trailing runs removed by remove_trailing_characters, in one pattern
+_TRAILING_CHARACTERS = re.compile(r'^[\[,\-]+|[\[\]:,\-@]+$')
+# Leading bracket and trailing bracket/colon/at sign removed by remove_numbers_and_brackets, in one pattern
+_BRACKETS = re.compile(r'^\[|\]:$|:$|]$|@$|:@$')
+_ONLY_SPECIAL = re.compile(r'^[\W_]+$')
+# First and last characters that can start a match of the patterns above, used to skip the regex for most values.
+# A final newline is included because $ also matches right before it.
+_SPECIAL_SIGNS = frozenset('[]:,')
+_TRAILING_START = frozenset('[,-')
+_TRAILING_END = frozenset('[]:,-@\n')
+_BRACKETS_END = frozenset(']:@\n')
+
+
 def load_json(file_path: str) -> dict:
     """
     Load data from a JSON file.
@@ -38,10 +51,70 @@ def clean_text_special_signs(text: Any) -> str:
     if isinstance(text, float):
         return str(text)
     cleaned_text = text.strip().lower()
-    cleaned_text = re.sub(r'^[\[\]:,]+|[\[\]:,]+$', '', cleaned_text)
+    if cleaned_text[:1] in _SPECIAL_SIGNS or cleaned_text[-1:] in _SPECIAL_SIGNS:
+        cleaned_text = _SPECIAL_SIGNS_EDGES.sub('', cleaned_text)
     return cleaned_text
 
 
+def clean_text_special_signs_vec(values: pd.Series) -> pd.Series:
+    """
+    Clean all values of a Series like `clean_text_special_signs`, using vectorized string operations.
+
+    Args:
+        values (pd.Series): The values to be cleaned.
+
+    Returns:
+        pd.Series: The cleaned values as strings.
+    """
+    try:
+        cleaned = values.str.strip().str.lower().str.replace(_SPECIAL_SIGNS_EDGES, '', regex=True)
+    except AttributeError:
+        return values.map(clean_text_special_signs)
+    non_string = cleaned.isna()
+    if non_string.any():
+        cleaned = cleaned.astype(object)
+        cleaned[non_string] = values[non_string].map(clean_text_special_signs)
+    return cleaned
+
+
+def cached_column_transform(values: pd.Series, transform: Callable, cache: dict = None) -> Any:
+    """
+    Apply a transform to a column, reusing an earlier result from the cache while the column is unchanged.
+
+    A cache should only ever be used with one transform, since its entries do not record which transform produced them.
+
+    Args:
+        values (pd.Series): The column values.
+        transform (Callable): The function computing the result from the column values.
+        cache (dict, optional): The cache of earlier results, keyed by column name.
+
+    Returns:
+        Any: The result of the transform.
+    """
+    if cache is not None:
+        entry = cache.get(values.name)
+        if entry is not None and entry[0].equals(values):
+            return entry[1]
+    result = transform(values)
+    if cache is not None:
+        cache[values.name] = (values.copy(), result)
+    return result
+
+
+def cached_clean_text_special_signs(values: pd.Series, cache: dict = None) -> pd.Series:
+    """
+    Clean a column like `clean_text_special_signs_vec`, reusing an earlier result from the cache while the column is unchanged.
+
+    Args:
+        values (pd.Series): The values to be cleaned.
+        cache (dict, optional): The cache of earlier results, keyed by column name.
+
+    Returns:
+        pd.Series: The cleaned values as strings.
+    """
+    return cached_column_transform(values, clean_text_special_signs_vec, cache)
+
+
 def lower_strip_text(text: Any) -> str:
     """
     Clean the input text by stripping leading and trailing whitespaces and converting to lowercase.
@@ -60,6 +133,27 @@ def lower_strip_text(text: Any) -> str:
     return cleaned_text
 
 
+def lower_strip_text_vec(values: pd.Series) -> pd.Series:
+    """
+    Clean all values of a Series like `lower_strip_text`, using vectorized string operations.
+
+    Args:
+        values (pd.Series): The values to be cleaned.
+
+    Returns:
+        pd.Series: The cleaned values as strings.
+    """
+    try:
+        cleaned = values.str.strip().str.lower()
+    except AttributeError:
+        return values.map(lower_strip_text)
+    non_string = cleaned.isna()
+    if non_string.any():
+        cleaned = cleaned.astype(object)
+        cleaned[non_string] = values[non_string].map(lower_strip_text)
+    return cleaned
+
+
 def remove_trailing_characters(text: Any) -> str:
     """
     Remove specific trailing characters from the input text.
@@ -74,10 +168,33 @@ def remove_trailing_characters(text: Any) -> str:
         return ''
     if isinstance(text, float):
         return str(text)
-    text = re.sub(r'^[\[,\-]+', '', text)
-    text = re.sub(r'[\[\]:,\-@]+$', '', text)
+    if text[:1] in _TRAILING_START or text[-1:] in _TRAILING_END:
+        return _TRAILING_CHARACTERS.sub('', text)
     return text
 
+
+def remove_trailing_characters_vec(values: pd.Series) -> pd.Series:
+    """
+    Remove specific leading and trailing characters from all values of a Series like `remove_trailing_characters`,
+    using vectorized string operations.
+
+    Args:
+        values (pd.Series): The values to be cleaned.
+
+    Returns:
+        pd.Series: The cleaned values as strings.
+    """
+    try:
+        cleaned = values.str.replace(_TRAILING_CHARACTERS, '', regex=True)
+    except AttributeError:
+        return values.map(remove_trailing_characters)
+    non_string = cleaned.isna()
+    if non_string.any():
+        cleaned = cleaned.astype(object)
+        cleaned[non_string] = values[non_string].map(remove_trailing_characters)
+    return cleaned
+
+
 def drop_empty_columns(df: pd.DataFrame) -> pd.DataFrame:
     """
     Drop columns that contain only empty strings or NaN values from a DataFrame.
@@ -88,85 +205,106 @@ def drop_empty_columns(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         pd.DataFrame: The cleaned DataFrame with empty columns dropped.
     """
-    columns_to_replace = [col for col in df.columns if df[col].replace(r'^\s*$', np.nan, regex=True).isna().all()]
-    
-    df[columns_to_replace] = df[columns_to_replace].replace(r'^\s*$', np.nan, regex=True)
+    empty_columns = [_is_empty_column(df.iloc[:, i]) for i in range(df.shape[1])]
     
-    df_cleaned = df.dropna(axis=1, how='all')
+    df_cleaned = df.loc[:, [not empty for empty in empty_columns]]
     
     return df_cleaned
 
 
-def contains_any(word: str, l1: list) -> bool:
+def _is_empty_column(values: pd.Series) -> bool:
+    """
+    Check if a column contains only empty or whitespace-only strings and NaN values.
+    """
+    try:
+        blank = values.str.strip().eq('')
+    except AttributeError:
+        return bool(values.isna().all())
+    return bool((values.isna() | blank).all())
+
+
+def compile_alternation(strings) -> re.Pattern:
     """
-    Check if the input word contains any of the elements in the provided list.
+    Compile a pattern that finds any of the given strings as a substring.
 
     Args:
-        word (str): The word to be checked.
-        l1 (list): The list of elements to check against.
+        strings (iterable): The strings to search for.
 
     Returns:
-        bool: True if any element from the list is found in the word, False otherwise.
+        re.Pattern: The compiled alternation, which never matches if there are no strings.
     """
-    return any(item in word for item in l1)
+    strings = list(strings)
+    if not strings:
+        return re.compile(r'(?!)')
+    return re.compile('|'.join(map(re.escape, strings)))
 
 
-def remove_pattern(text: str, pattern: str) -> str:
+def remove_numbers_and_brackets(text: str) -> str:
     """
-    Remove a specific pattern from the input text.
+    Remove numbers and brackets from the input text.
 
     Args:
         text (str): The input text to be cleaned.
-        pattern (str): The pattern to be removed.
 
     Returns:
-        str: The cleaned text with the pattern removed.
+        str: The cleaned text with numbers and brackets removed.
     """
-    return re.sub(pattern, '', text).strip()
+    if text is None:
+        return ''
+    if text[:1] == '[' or text[-1:] in _BRACKETS_END:
+        return _BRACKETS.sub('', text)
+    return text
 
 
-def matches_pattern(text: str, pattern: str) -> bool:
+def remove_numbers_and_brackets_vec(values: pd.Series) -> pd.Series:
     """
-    Check if the input text matches a specific pattern.
+    Clean all values of a Series like `remove_numbers_and_brackets`, using vectorized string operations.
 
     Args:
-        text (str): The input text to be checked.
-        pattern (str): The pattern to check against.
+        values (pd.Series): The values to be cleaned.
 
     Returns:
-        bool: True if the pattern is found in the text, False otherwise.
+        pd.Series: The cleaned values as strings.
     """
-    return bool(re.search(pattern, text))
+    try:
+        cleaned = values.str.replace(_BRACKETS, '', regex=True)
+    except AttributeError:
+        return values.map(remove_numbers_and_brackets)
+    non_string = cleaned.isna()
+    if non_string.any():
+        cleaned = cleaned.astype(object)
+        cleaned[non_string] = values[non_string].map(remove_numbers_and_brackets)
+    return cleaned
 
 
-def remove_numbers_and_brackets(text: str) -> str:
+def is_only_numeric(val):
     """
-    Remove numbers and brackets from the input text.
+    Check if the given value contains only numeric characters.
 
     Args:
-        text (str): The input text to be cleaned.
+        val (str): The value to be checked.
 
     Returns:
-        str: The cleaned text with numbers and brackets removed.
+        bool: True if the value contains only numeric characters, False otherwise.
     """
-    if text is None:
-        return ''
-    text = re.sub(r'^\[', '', text)
-    text = re.sub(r'\]:$|:$|]$|@$|:@$', '', text) 
-    return text
+    text = str(val)
+    # same as matching ^\d+$: \d is a Unicode decimal digit and $ also matches before a final newline
+    if text.endswith('\n'):
+        text = text[:-1]
+    return text.isdecimal()
 
 
-def is_only_numeric(val):
+def is_only_numeric_vec(values: pd.Series) -> pd.Series:
     """
-    Check if the given value contains only numeric characters.
+    Check all values of a Series like `is_only_numeric`, using vectorized string operations.
 
     Args:
-        val (str): The value to be checked.
+        values (pd.Series): The values to be checked.
 
     Returns:
-        bool: True if the value contains only numeric characters, False otherwise.
+        pd.Series: True where the value contains only numeric characters.
     """
-    return bool(re.match(r'^\d+$', str(val)))
+    return values.astype(str).str.removesuffix('\n').str.isdecimal()
 
 
 def is_only_special(val):
@@ -179,7 +317,20 @@ def is_only_special(val):
     Returns:
         bool: True if the value contains only special characters, False otherwise.
     """
-    return bool(re.match(r'^[\W_]+$', str(val))) 
+    return _ONLY_SPECIAL.match(str(val)) is not None
+
+
+def is_only_special_vec(values: pd.Series) -> pd.Series:
+    """
+    Check all values of a Series like `is_only_special`, using vectorized string operations.
+
+    Args:
+        values (pd.Series): The values to be checked.
+
+    Returns:
+        pd.Series: True where the value contains only special characters.
+    """
+    return values.astype(str).str.match(_ONLY_SPECIAL)
 
 
 def remove_columns_with_special_characters(df):
@@ -192,12 +343,8 @@ def remove_columns_with_special_characters(df):
     Returns:
         pd.DataFrame: The DataFrame with specified columns removed.
     """
-    for column in df.columns:
-        if column.startswith('Col_'):
-            if all(df[column].apply(is_only_special)):
-                df = df.drop(columns=[column])
+    special_columns = [column.startswith('Col_') and bool(is_only_special_vec(df.iloc[:, i]).all())
+                       for i, column in enumerate(df.columns)]
+    if any(special_columns):
+        df = df.loc[:, [not special for special in special_columns]]
     return df
-
-
-
-
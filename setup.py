@@ -13,6 +13,9 @@ setup(
         'six==1.16.0',
         'tzdata==2024.1'
     ],
+    extras_require={
+        'fast': ['faust-cchardet==2.1.19'],
+    },
     entry_points={
         'console_scripts': [
             'log_parser_package=log_parser.log_structurer:main',
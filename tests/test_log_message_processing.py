@@ -0,0 +1,26 @@
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'log_parser'))
+
+from log_message_processing import load_and_split_messages
+
+
+class LoadAndSplitMessagesTest(unittest.TestCase):
+
+    def test_non_ascii_line_after_the_encoding_sample(self):
+        lines = [b'2024-01-01 12:00:00 INFO ok line\n'] * 3000 + ['2024-01-01 12:00:00 INFO caf\xe9\n'.encode('latin-1')]
+        with tempfile.NamedTemporaryFile(suffix='.log', delete=False) as file:
+            file.write(b''.join(lines))
+        try:
+            selected_messages, remaining_messages = load_and_split_messages(file.name)
+        finally:
+            os.remove(file.name)
+        self.assertEqual(len(selected_messages) + len(remaining_messages), 3001)
+        self.assertEqual(selected_messages[-1][0], 3000)
+
+
+if __name__ == '__main__':
+    unittest.main()
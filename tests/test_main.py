@@ -0,0 +1,55 @@
+import os
+import sys
+import unittest
+from unittest import mock
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'log_parser'))
+
+import main
+from date_time_processing import DateFinderPlural, TimeFinderPlural
+
+
+FUNCTIONS = [
+    ('process_time_date_columns', {'finder_class': TimeFinderPlural, 'column_type': 'time'}),
+    ('process_time_date_columns', {'finder_class': DateFinderPlural, 'column_type': 'date'}),
+]
+
+
+def make_df(dates):
+    return pd.DataFrame({
+        'Col_0': dates,
+        'Col_1': ['12:%02d:%02d' % (i % 60, i % 60) for i in range(len(dates))],
+        'Col_2': ['message %d' % i for i in range(len(dates))],
+    })
+
+
+class ApplyFunctionsInParallelTest(unittest.TestCase):
+
+    def run_in_chunks(self, df):
+        serial = main.apply_functions_to_dataframe(df.copy(), FUNCTIONS)
+        with mock.patch.object(main, '_MIN_ROWS_PER_WORKER', 100), \
+                mock.patch.object(main.os, 'cpu_count', return_value=4), \
+                mock.patch.object(main, 'apply_functions_to_dataframe',
+                                  wraps=main.apply_functions_to_dataframe) as serial_calls:
+            parallel = main.apply_functions_in_parallel(df.copy(), FUNCTIONS)
+        return serial, parallel, serial_calls
+
+    def test_agreeing_chunks_are_combined(self):
+        df = make_df(['2024-05-%02d' % (i % 28 + 1) for i in range(400)])
+        serial, parallel, serial_calls = self.run_in_chunks(df)
+        serial_calls.assert_not_called()
+        pd.testing.assert_frame_equal(parallel, serial)
+
+    def test_disagreeing_finders_fall_back_to_serial(self):
+        # The first half only reads as mm/dd and the second half only as dd/mm, the columns agree
+        dates = ['05/%02d/2024' % (i % 15 + 13) for i in range(200)] + ['%02d/05/2024' % (i % 15 + 13) for i in range(200)]
+        df = make_df(dates)
+        serial, parallel, serial_calls = self.run_in_chunks(df)
+        serial_calls.assert_called_once()
+        pd.testing.assert_frame_equal(parallel, serial)
+
+
+if __name__ == '__main__':
+    unittest.main()